@@ -5,11 +5,34 @@ Dependency injection for FastAPI endpoints
 from fastapi import Depends
 from functools import lru_cache
 from typing import Optional
+import asyncio
 import asyncpg
 from supabase import create_client, Client
 import redis.asyncio as redis
+import json
 import logging
 
+try:
+    import orjson
+    
+    def _jsonb_encode(value) -> str:
+        return value if isinstance(value, str) else orjson.dumps(value).decode()
+    
+    _jsonb_decode = orjson.loads
+except ImportError:
+    def _jsonb_encode(value) -> str:
+        return value if isinstance(value, str) else json.dumps(value)
+    
+    _jsonb_decode = json.loads
+
+try:
+    from arq import create_pool as create_arq_pool
+    from arq.connections import ArqRedis, RedisSettings
+    ARQ_AVAILABLE = True
+except ImportError:
+    ArqRedis = None
+    ARQ_AVAILABLE = False
+
 from app.config.settings import get_settings, Settings
 from app.services.document_service import DocumentService
 from app.services.processing_service import ProcessingService
@@ -18,32 +41,110 @@ from app.services.zone_service import ZoneService
 
 logger = logging.getLogger(__name__)
 
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Decode jsonb straight to Python objects once per pooled connection.
+    
+    Pre-serialized JSON strings are passed through unchanged, so existing
+    ``$n::jsonb`` parameters keep working alongside dicts and lists.
+    """
+    await conn.set_type_codec(
+        'jsonb',
+        encoder=_jsonb_encode,
+        decoder=_jsonb_decode,
+        schema='pg_catalog'
+    )
+
 # Database connection pool
 _db_pool = None
+_db_pool_lock = asyncio.Lock()
+_db_read_pool = None
+_db_read_pool_lock = asyncio.Lock()
+_db_health_task = None
 _redis_client = None
 _supabase_client = None
+_arq_pool = None
+_arq_pool_lock = asyncio.Lock()
+_arq_pool_retry_at = 0.0
+
+# After a failed task queue connect, jobs run in-process for this many seconds
+# before connecting is tried again, so requests don't each wait out the
+# connect timeout while Redis is down
+ARQ_CONNECT_COOLDOWN = 30
 
 async def get_database_pool() -> Optional[asyncpg.Pool]:
     """Get database connection pool"""
     global _db_pool
-    if _db_pool is None:
-        settings = get_settings()
-        try:
-            _db_pool = await asyncpg.create_pool(
-                settings.database_url,
-                min_size=5,
-                max_size=settings.database_pool_size,
-                max_queries=50000,
-                max_inactive_connection_lifetime=300,
-                command_timeout=60
-            )
-            logger.info("Database connection pool created successfully")
-        except Exception as e:
-            logger.warning(f"Database not available (demo mode): {e}")
-            # Return None for demo mode - services will handle this gracefully
-            return None
+    if _db_pool is not None:
+        return _db_pool
+    
+    # Concurrent first requests must not each open their own pool
+    async with _db_pool_lock:
+        if _db_pool is None:
+            settings = get_settings()
+            try:
+                _db_pool = await asyncpg.create_pool(
+                    settings.database_url,
+                    min_size=settings.database_pool_min_size,
+                    max_size=settings.database_pool_size,
+                    max_queries=50000,
+                    max_inactive_connection_lifetime=300,
+                    statement_cache_size=settings.database_statement_cache_size,
+                    command_timeout=60,
+                    init=_init_connection
+                )
+                logger.info(
+                    "Database connection pool created successfully "
+                    "(min_size=%d, max_size=%d, statement_cache_size=%d)",
+                    settings.database_pool_min_size,
+                    settings.database_pool_size,
+                    settings.database_statement_cache_size
+                )
+            except Exception as e:
+                logger.warning(f"Database not available (demo mode): {e}")
+                # Return None for demo mode - services will handle this gracefully
+                return None
     return _db_pool
 
+async def get_read_database_pool() -> Optional[asyncpg.Pool]:
+    """Get read-only database connection pool (falls back to the primary pool)"""
+    global _db_read_pool
+    if _db_read_pool is not None:
+        return _db_read_pool
+    
+    primary_pool = await get_database_pool()
+    if primary_pool is None:
+        return None
+    
+    # Without a separate replica a second pool would only open more
+    # connections to the same server
+    settings = get_settings()
+    if not settings.database_read_url or settings.database_read_url == settings.database_url:
+        return primary_pool
+    
+    async with _db_read_pool_lock:
+        if _db_read_pool is None:
+            try:
+                _db_read_pool = await asyncpg.create_pool(
+                    settings.database_read_url,
+                    min_size=settings.database_pool_min_size,
+                    max_size=settings.database_read_pool_size,
+                    max_queries=50000,
+                    max_inactive_connection_lifetime=300,
+                    statement_cache_size=settings.database_statement_cache_size,
+                    command_timeout=60,
+                    init=_init_connection
+                )
+                logger.info(
+                    "Read database connection pool created successfully "
+                    "(min_size=%d, max_size=%d)",
+                    settings.database_pool_min_size,
+                    settings.database_read_pool_size
+                )
+            except Exception as e:
+                logger.warning(f"Read database pool not available, using primary pool: {e}")
+                return primary_pool
+    return _db_read_pool
+
 async def get_redis_client() -> redis.Redis:
     """Get Redis client"""
     global _redis_client
@@ -67,6 +168,31 @@ async def get_redis_client() -> redis.Redis:
             _redis_client = None
     return _redis_client
 
+async def get_arq_pool() -> Optional["ArqRedis"]:
+    """Get arq task queue pool"""
+    global _arq_pool, _arq_pool_retry_at
+    if _arq_pool is not None or not ARQ_AVAILABLE:
+        return _arq_pool
+    
+    loop = asyncio.get_running_loop()
+    if loop.time() < _arq_pool_retry_at:
+        return None
+    
+    # Concurrent callers share one connection attempt
+    async with _arq_pool_lock:
+        if _arq_pool is None and loop.time() >= _arq_pool_retry_at:
+            settings = get_settings()
+            try:
+                _arq_pool = await create_arq_pool(RedisSettings.from_dsn(settings.redis_url))
+                logger.info("Task queue pool connected successfully")
+            except Exception as e:
+                _arq_pool_retry_at = loop.time() + ARQ_CONNECT_COOLDOWN
+                logger.warning(
+                    f"Task queue connection failed: {e}. Running jobs in-process "
+                    f"for {ARQ_CONNECT_COOLDOWN}s before retrying."
+                )
+    return _arq_pool
+
 async def get_supabase_client() -> Optional[Client]:
     """Get Supabase client"""
     global _supabase_client
@@ -99,13 +225,15 @@ async def get_document_service() -> DocumentService:
 async def get_processing_service() -> ProcessingService:
     """Get processing service instance"""
     db_pool = await get_database_pool()
+    db_pool_read = await get_read_database_pool()
     redis_client = await get_redis_client()
-    document_service = await get_document_service()
+    arq_pool = await get_arq_pool()
     
     return ProcessingService(
         db_pool=db_pool,
+        db_pool_read=db_pool_read,
         redis_client=redis_client,
-        document_service=document_service
+        arq_pool=arq_pool
     )
 
 async def get_export_service() -> ExportService:
@@ -147,8 +275,12 @@ async def get_current_user_id() -> str:
 
 # Cleanup functions for graceful shutdown
 async def close_database_pool():
-    """Close database connection pool"""
-    global _db_pool
+    """Close database connection pools"""
+    global _db_pool, _db_read_pool
+    if _db_read_pool:
+        await _db_read_pool.close()
+        _db_read_pool = None
+        logger.info("Read database connection pool closed")
     if _db_pool:
         await _db_pool.close()
         _db_pool = None
@@ -200,6 +332,31 @@ async def check_database_health() -> bool:
         logger.error(f"Database health check failed: {e}")
         return False
 
+async def _database_health_loop(interval: int):
+    """Periodically exercise the pool so dead connections are recycled early"""
+    while True:
+        await asyncio.sleep(interval)
+        if _db_pool is not None:
+            await check_database_health()
+
+def start_database_health_check():
+    """Start the periodic database health check"""
+    global _db_health_task
+    if _db_health_task is None:
+        interval = get_settings().database_health_check_interval
+        _db_health_task = asyncio.create_task(_database_health_loop(interval))
+
+async def stop_database_health_check():
+    """Stop the periodic database health check"""
+    global _db_health_task
+    if _db_health_task is not None:
+        _db_health_task.cancel()
+        try:
+            await _db_health_task
+        except asyncio.CancelledError:
+            pass
+        _db_health_task = None
+
 async def check_redis_health() -> bool:
     """Check Redis connectivity"""
     try:
@@ -350,6 +507,7 @@ async def get_rate_limiter() -> RateLimiter:
 _connection_manager = None
 _processing_progress_emitter = None
 _message_queue = None
+_progress_relay = None
 
 async def get_connection_manager() -> "ConnectionManager":
     """Get WebSocket connection manager"""
@@ -385,6 +543,24 @@ async def get_processing_progress_emitter() -> "ProcessingProgressEmitter":
         logger.info("Processing progress emitter initialized")
     return _processing_progress_emitter
 
+async def get_progress_relay() -> Optional["ProgressRelay"]:
+    """Get the progress relay (Redis pub/sub, or Postgres LISTEN without Redis)"""
+    global _progress_relay
+    if _progress_relay is None:
+        redis_client = await get_redis_client()
+        db_pool = None if redis_client is not None else await get_database_pool()
+        if redis_client is None and db_pool is None:
+            return None
+        
+        from .websocket.progress import ProgressRelay
+        
+        connection_manager = await get_connection_manager()
+        _progress_relay = ProgressRelay(connection_manager, redis_client=redis_client, db_pool=db_pool)
+        await _progress_relay.start()
+        
+        logger.info("Processing progress relay started")
+    return _progress_relay
+
 async def get_message_queue() -> "MessageQueue":
     """Get message queue"""
     global _message_queue
@@ -404,8 +580,16 @@ async def get_message_queue() -> "MessageQueue":
 
 # WebSocket Cleanup Functions
 async def cleanup_database_pool():
-    """Cleanup database connection pool"""
-    global _db_pool
+    """Cleanup database connection pools"""
+    global _db_pool, _db_read_pool
+    if _db_read_pool is not None:
+        try:
+            await _db_read_pool.close()
+            logger.info("Read database connection pool closed")
+        except Exception as e:
+            logger.error(f"Error closing read database pool: {e}")
+        finally:
+            _db_read_pool = None
     if _db_pool is not None:
         try:
             await _db_pool.close()
@@ -427,11 +611,28 @@ async def cleanup_redis_client():
         finally:
             _redis_client = None
 
+async def cleanup_arq_pool():
+    """Cleanup task queue pool"""
+    global _arq_pool
+    if _arq_pool is not None:
+        try:
+            await _arq_pool.close()
+            logger.info("Task queue pool closed")
+        except Exception as e:
+            logger.error(f"Error closing task queue pool: {e}")
+        finally:
+            _arq_pool = None
+
 async def cleanup_websocket_resources():
     """Cleanup WebSocket resources"""
-    global _connection_manager, _message_queue, _processing_progress_emitter
+    global _connection_manager, _message_queue, _processing_progress_emitter, _progress_relay
     
     try:
+        if _progress_relay is not None:
+            await _progress_relay.stop()
+            logger.info("Processing progress relay stopped")
+            _progress_relay = None
+            
         if _connection_manager is not None:
             await _connection_manager.stop()
             logger.info("Connection manager stopped")
@@ -14,6 +14,7 @@ import logging
 from app.routers import documents, processing, export, websocket, zones
 from app.middleware.errors import ErrorHandlerMiddleware
 from app.middleware.logging import LoggingMiddleware
+from app.middleware.request_cache import RequestCacheMiddleware
 from app.config.settings import get_settings
 
 # Configure logging
@@ -51,6 +52,7 @@ app.add_middleware(
 # Add custom middleware
 app.add_middleware(ErrorHandlerMiddleware)
 app.add_middleware(LoggingMiddleware)
+app.add_middleware(RequestCacheMiddleware)
 
 # Request middleware for timing and IDs
 @app.middleware("http")
@@ -109,11 +111,17 @@ async def startup_event():
     """Initialize application resources on startup"""
     logger.info("Starting PDF Intelligence Platform backend...")
     
+    # Create the shared database pool once, before the first request
+    from app.dependencies import get_database_pool, start_database_health_check
+    if await get_database_pool() is not None:
+        start_database_health_check()
+    
     # Initialize WebSocket resources
     try:
-        from app.dependencies import get_connection_manager, get_message_queue
+        from app.dependencies import get_connection_manager, get_message_queue, get_progress_relay
         connection_manager = await get_connection_manager()
         message_queue = await get_message_queue()
+        await get_progress_relay()
         logger.info("WebSocket infrastructure initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize WebSocket infrastructure: {e}")
@@ -128,9 +136,16 @@ async def shutdown_event():
     
     # Clean up WebSocket resources
     try:
-        from app.dependencies import cleanup_websocket_resources, cleanup_database_pool, cleanup_redis_client
+        from app.dependencies import (
+            cleanup_websocket_resources, cleanup_database_pool,
+            cleanup_redis_client, cleanup_arq_pool, stop_database_health_check
+        )
+        from app.services.zone_service import drain_zone_cache_invalidations
+        await stop_database_health_check()
         await cleanup_websocket_resources()
+        await cleanup_arq_pool()
         await cleanup_database_pool()
+        await drain_zone_cache_invalidations()
         await cleanup_redis_client()
         logger.info("Application resources cleaned up successfully")
     except Exception as e:
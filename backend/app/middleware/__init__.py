@@ -4,8 +4,11 @@ Middleware package for the PDF Intelligence Platform API
 
 from .errors import ErrorHandlerMiddleware
 from .logging import LoggingMiddleware
+from .request_cache import RequestCacheMiddleware, get_request_cache
 
 __all__ = [
     "ErrorHandlerMiddleware",
-    "LoggingMiddleware"
+    "LoggingMiddleware",
+    "RequestCacheMiddleware",
+    "get_request_cache"
 ] 
\ No newline at end of file
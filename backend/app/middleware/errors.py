@@ -160,6 +160,16 @@ class ZoneProcessingError(APIError):
             details={"zone_id": zone_id, **(details or {})}
         )
 
+class InvalidCursorError(APIError):
+    """Invalid pagination cursor error"""
+    def __init__(self, cursor: str):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            error_code="INVALID_CURSOR",
+            message=f"Invalid pagination cursor '{cursor}'",
+            details={"cursor": cursor}
+        )
+
 class ErrorHandlerMiddleware(BaseHTTPMiddleware):
     """Middleware to handle exceptions and return structured error responses"""
     
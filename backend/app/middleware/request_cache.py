@@ -0,0 +1,25 @@
+"""
+Request-scoped memoization of shared cache reads
+"""
+
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+_request_cache: ContextVar[Optional[Dict[Any, Any]]] = ContextVar("request_cache", default=None)
+
+def get_request_cache() -> Optional[Dict[Any, Any]]:
+    """The current request's memo, or None outside a request (workers, websockets)"""
+    return _request_cache.get()
+
+class RequestCacheMiddleware(BaseHTTPMiddleware):
+    """Give every request a fresh memo so repeated Redis reads cost one round trip"""
+    
+    async def dispatch(self, request: Request, call_next):
+        token = _request_cache.set({})
+        try:
+            return await call_next(request)
+        finally:
+            _request_cache.reset(token)
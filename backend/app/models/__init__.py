@@ -48,6 +48,7 @@ from .export import (
 from .base import (
     BaseModel,
     PaginatedResponse,
+    CursorPaginatedResponse,
     ErrorResponse,
     SuccessResponse
 )
@@ -94,6 +95,7 @@ __all__ = [
     # Base models
     "BaseModel",
     "PaginatedResponse",
+    "CursorPaginatedResponse",
     "ErrorResponse",
     "SuccessResponse"
 ] 
\ No newline at end of file
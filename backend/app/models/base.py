@@ -40,6 +40,13 @@ class PaginatedResponse(BaseModel, Generic[T]):
     has_next: bool = Field(..., description="Whether there's a next page")
     has_prev: bool = Field(..., description="Whether there's a previous page")
 
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """Generic keyset-paginated response"""
+    items: List[T] = Field(..., description="List of items")
+    size: int = Field(..., description="Items per page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if any")
+    has_next: bool = Field(..., description="Whether there's a next page")
+
 class ErrorResponse(BaseModel):
     """Standard error response"""
     error_code: str = Field(..., description="Error code")
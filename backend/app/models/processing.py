@@ -3,13 +3,23 @@ Processing-related Pydantic models
 """
 
 from pydantic import Field, validator
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+import json
+from typing import Optional, Dict, Any, List, Mapping
+from datetime import datetime, timezone
 from enum import Enum
 from uuid import UUID
 
 from .base import BaseModel, UUIDMixin, TimestampMixin
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+def _jsonb(value: Any) -> Any:
+    """Decode a JSONB column (asyncpg returns text without a registered codec)"""
+    return _json_loads(value) if isinstance(value, str) else value
+
 class ProcessingStatus(str, Enum):
     """Processing job status"""
     QUEUED = "queued"
@@ -69,6 +79,20 @@ class ZoneCoordinates(BaseModel):
     height: float = Field(..., gt=0, description="Height")
     page_width: float = Field(..., gt=0, description="Page width")
     page_height: float = Field(..., gt=0, description="Page height")
+    
+    @classmethod
+    def from_record(cls, r: Mapping[str, Any]) -> "ZoneCoordinates":
+        """Build from a zones row, preferring the typed coordinate columns over the JSONB"""
+        if "x" in r and r["x"] is not None:
+            return cls.model_construct(
+                x=r["x"],
+                y=r["y"],
+                width=r["width"],
+                height=r["height"],
+                page_width=r["page_width"],
+                page_height=r["page_height"]
+            )
+        return cls.model_construct(**_jsonb(r["coordinates"]))
 
 class ZoneUpdate(BaseModel):
     """Model for updating zone information"""
@@ -80,6 +104,10 @@ class ZoneUpdate(BaseModel):
     coordinates: Optional[ZoneCoordinates] = Field(None, description="Zone coordinates")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
 
+class ZoneBulkUpdate(ZoneUpdate):
+    """One entry of a bulk zone update"""
+    zone_id: UUID = Field(..., description="Zone ID to update")
+
 class Zone(BaseModel, UUIDMixin, TimestampMixin):
     """Complete zone model"""
     document_id: UUID = Field(..., description="Parent document ID")
@@ -100,6 +128,28 @@ class ZoneResponse(Zone):
     content_preview: str = Field(default="", description="Preview of content")
     word_count: int = Field(default=0, description="Number of words")
     character_count: int = Field(default=0, description="Number of characters")
+    
+    @classmethod
+    def from_record(cls, r: Mapping[str, Any]) -> "ZoneResponse":
+        """Build from a zones row without re-running validation"""
+        confidence = r["confidence"]
+        return cls.model_construct(
+            id=r["id"],
+            document_id=r["document_id"],
+            zone_index=r["zone_index"],
+            page_number=r["page_number"],
+            zone_type=ZoneType(r["zone_type"]),
+            coordinates=ZoneCoordinates.from_record(r),
+            content=r["content"],
+            confidence=float(confidence) if confidence is not None else None,
+            processing_tool=r["processing_tool"],
+            status=ZoneStatus(r["status"]),
+            error_message=r["error_message"],
+            processing_duration=r["processing_duration"],
+            metadata=_jsonb(r["metadata"]) or {},
+            created_at=r["created_at"],
+            updated_at=r["updated_at"]
+        )
 
 class ProcessingJob(BaseModel, UUIDMixin, TimestampMixin):
     """Processing job model"""
@@ -150,6 +200,54 @@ class ProcessingResponse(ProcessingJob):
         if total_zones > 0:
             return ((total_zones - failed_zones) / total_zones) * 100
         return 100.0
+    
+    @classmethod
+    def from_record(cls, r: Mapping[str, Any]) -> "ProcessingResponse":
+        """Build from a processing_jobs row without re-running validation.
+        
+        The computed fields are derived here the same way the validators above do.
+        """
+        started, completed = r["started_at"], r["completed_at"]
+        if started and completed:
+            duration = (completed - started).total_seconds()
+        elif started:
+            now = datetime.now(timezone.utc) if started.tzinfo else datetime.utcnow()
+            duration = (now - started).total_seconds()
+        else:
+            duration = None
+        
+        total_zones = r["total_zones"]
+        completed_zones = r["completed_zones"]
+        failed_zones = r["failed_zones"]
+        
+        return cls.model_construct(
+            id=r["id"],
+            document_id=r["document_id"],
+            status=ProcessingStatus(r["status"]),
+            strategy=ProcessingStrategy(r["strategy"]),
+            started_at=started,
+            completed_at=completed,
+            progress=float(r["progress"]),
+            current_zone_id=r["current_zone_id"],
+            total_zones=total_zones,
+            completed_zones=completed_zones,
+            failed_zones=failed_zones,
+            error_count=r["error_count"],
+            error_message=r["error_message"],
+            estimated_completion=r["estimated_completion"],
+            options=_jsonb(r["options"]) or {},
+            metrics=_jsonb(r["metrics"]) or {},
+            created_at=r["created_at"],
+            updated_at=r["updated_at"],
+            duration=duration,
+            zones_per_minute=(
+                completed_zones / duration * 60
+                if duration and duration > 0 and completed_zones > 0 else None
+            ),
+            success_rate=(
+                (total_zones - failed_zones) / total_zones * 100 if total_zones > 0 else 100.0
+            )
+        )
 
 class ProcessingStatsResponse(BaseModel):
     """Processing statistics response"""
@@ -2,9 +2,10 @@
 Processing control API endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
-from fastapi.responses import StreamingResponse
-from typing import List, Optional, AsyncGenerator
+from fastapi import APIRouter, Body, Depends, HTTPException, status, Query, BackgroundTasks
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
+from typing import List, Optional, AsyncGenerator, Union
 from uuid import UUID
 import logging
 import asyncio
@@ -12,19 +13,28 @@ import json
 
 from app.models.processing import (
     ProcessingRequest, ProcessingResponse, ProcessingStatsResponse,
-    ZoneUpdate, ZoneResponse, ProcessingHistory
+    ZoneUpdate, ZoneBulkUpdate, ZoneResponse, ProcessingHistory
 )
-from app.models.base import SuccessResponse, PaginatedResponse
-from app.services.processing_service import ProcessingService
+from app.models.base import SuccessResponse, PaginatedResponse, CursorPaginatedResponse
+from app.services.processing_service import ProcessingService, progress_channel
 from app.middleware.errors import (
     DocumentNotFoundError, ProcessingJobNotFoundError, ZoneNotFoundError,
-    ProcessingInProgressError, ProcessingCapacityExceededError
+    ProcessingInProgressError, ProcessingCapacityExceededError, InvalidCursorError
 )
 from app.dependencies import get_processing_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+# Upper bound on zones per bulk update request, which runs as one transaction
+MAX_BULK_ZONE_UPDATES = 1000
+
+# List endpoints serialize straight to JSON bytes with pydantic-core instead of
+# going through jsonable_encoder and the stdlib json encoder
+_ZONE_LIST_ADAPTER = TypeAdapter(List[ZoneResponse])
+
 @router.post("/{document_id}", response_model=ProcessingResponse)
 async def start_processing(
     document_id: UUID,
@@ -62,11 +72,11 @@ async def start_processing(
         )
         
         # Queue for background processing
-        background_tasks.add_task(
-            processing_service.process_document_background,
+        await processing_service.enqueue_processing(
             job.id,
             document_id,
-            processing_request
+            processing_request,
+            background_tasks
         )
         
         logger.info(
@@ -220,7 +230,7 @@ async def get_document_zones(
             filters["status"] = status
         
         zones = await processing_service.get_document_zones(document_id, filters)
-        return zones
+        return Response(content=_ZONE_LIST_ADAPTER.dump_json(zones), media_type="application/json")
     
     except Exception as e:
         logger.error(f"Error getting zones for document {document_id}: {str(e)}")
@@ -229,6 +239,45 @@ async def get_document_zones(
             detail="Failed to get document zones"
         )
 
+@router.patch("/{document_id}/zones")
+async def bulk_update_zones(
+    document_id: UUID,
+    zone_updates: List[ZoneBulkUpdate] = Body(..., max_length=MAX_BULK_ZONE_UPDATES),
+    processing_service: ProcessingService = Depends(get_processing_service)
+):
+    """
+    Update many zones in one request
+    
+    - **document_id**: Document ID
+    - **zone_updates**: Zone IDs with the fields to update for each
+    - Returns the number of zones updated; if any zone is not part of the
+      document, nothing is updated and the response is 404
+    """
+    try:
+        updated_count = await processing_service.bulk_update_zones(
+            document_id,
+            [(zone_update.zone_id, zone_update) for zone_update in zone_updates]
+        )
+        
+        logger.info(
+            f"Bulk zone update: {updated_count} zones",
+            extra={"document_id": str(document_id)}
+        )
+        
+        return SuccessResponse(
+            message="Zones updated successfully",
+            data={"document_id": str(document_id), "updated_count": updated_count}
+        )
+    
+    except ZoneNotFoundError:
+        raise
+    except Exception as e:
+        logger.error(f"Error bulk updating zones for document {document_id}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to update zones"
+        )
+
 @router.patch("/{document_id}/zones/{zone_id}", response_model=ZoneResponse)
 async def update_zone(
     document_id: UUID,
@@ -270,12 +319,17 @@ async def update_zone(
             detail="Failed to update zone"
         )
 
-@router.get("/jobs", response_model=PaginatedResponse[ProcessingResponse])
+@router.get(
+    "/jobs",
+    response_model=Union[PaginatedResponse[ProcessingResponse], CursorPaginatedResponse[ProcessingResponse]]
+)
 async def list_processing_jobs(
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(20, ge=1, le=100, description="Items per page"),
     status: Optional[str] = Query(None, description="Filter by job status"),
     document_id: Optional[UUID] = Query(None, description="Filter by document ID"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous next_cursor"),
+    keyset: bool = Query(False, description="Use keyset pagination (no total count)"),
     processing_service: ProcessingService = Depends(get_processing_service)
 ):
     """
@@ -285,6 +339,7 @@ async def list_processing_jobs(
     - **size**: Items per page (default: 20, max: 100)
     - **status**: Filter by job status
     - **document_id**: Filter by specific document
+    - **cursor** / **keyset**: Switch to keyset pagination; follow next_cursor for deeper pages
     """
     try:
         filters = {}
@@ -296,11 +351,15 @@ async def list_processing_jobs(
         result = await processing_service.list_processing_jobs(
             page=page,
             size=size,
-            filters=filters
+            filters=filters,
+            cursor=cursor,
+            keyset=keyset
         )
         
-        return result
+        return Response(content=result.model_dump_json(), media_type="application/json")
     
+    except InvalidCursorError:
+        raise
     except Exception as e:
         logger.error(f"Error listing processing jobs: {str(e)}")
         raise HTTPException(
@@ -437,40 +496,77 @@ async def stream_processing_progress(
     - **document_id**: Document ID to stream progress for
     - Returns SSE stream of progress updates
     """
+    def job_event_data(job: ProcessingResponse) -> dict:
+        return {
+            "document_id": str(document_id),
+            "status": job.status,
+            "progress": job.progress,
+            "total_zones": job.total_zones,
+            "completed_zones": job.completed_zones,
+            "current_zone_id": str(job.current_zone_id) if job.current_zone_id else None,
+            "error_message": job.error_message,
+            "is_complete": job.status in TERMINAL_STATUSES
+        }
+    
     async def event_generator() -> AsyncGenerator[str, None]:
         """Generate SSE events for processing progress"""
+        pubsub = None
         try:
-            # Keep connection alive and stream updates
-            while True:
-                # Get current processing status
-                job = await processing_service.get_latest_job(document_id)
-                
-                if job:
-                    # Create SSE event data
-                    event_data = {
-                        "document_id": str(document_id),
-                        "status": job.status,
-                        "progress": job.progress,
-                        "total_zones": job.total_zones,
-                        "completed_zones": job.completed_zones,
-                        "current_zone_id": str(job.current_zone_id) if job.current_zone_id else None,
-                        "error_message": job.error_message,
-                        "is_complete": job.status in ["completed", "failed", "cancelled"]
-                    }
+            job = await processing_service.get_latest_job(document_id)
+            if not job:
+                # No job found, send empty status
+                yield f"data: {json.dumps({'document_id': str(document_id), 'status': 'not_found'})}\n\n"
+                return
+            
+            redis_client = processing_service.redis_client
+            if redis_client and job.status not in TERMINAL_STATUSES:
+                # Subscribe to pushed updates, then re-read so a transition that
+                # happened before the subscription took effect is not missed
+                pubsub = redis_client.pubsub()
+                await pubsub.subscribe(progress_channel(job.id))
+                job = await processing_service.get_latest_job(document_id) or job
+            
+            event_data = job_event_data(job)
+            yield f"data: {json.dumps(event_data)}\n\n"
+            if event_data["is_complete"]:
+                return
+            
+            if pubsub is not None:
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    update = json.loads(message["data"])
+                    if update["status"] in TERMINAL_STATUSES:
+                        # Final totals are only on the row
+                        job = await processing_service.get_latest_job(document_id) or job
+                        event_data = job_event_data(job)
+                    else:
+                        event_data.update(
+                            status=update["status"],
+                            progress=update["progress"],
+                            error_message=update.get("error_message")
+                        )
                     
-                    # Send SSE event
                     yield f"data: {json.dumps(event_data)}\n\n"
-                    
-                    # If processing is complete, close the stream
                     if event_data["is_complete"]:
                         break
-                else:
-                    # No job found, send empty status
+                return
+            
+            # No Redis: fall back to polling the job row
+            while True:
+                await asyncio.sleep(1)
+                job = await processing_service.get_latest_job(document_id)
+                
+                if not job:
                     yield f"data: {json.dumps({'document_id': str(document_id), 'status': 'not_found'})}\n\n"
                     break
                 
-                # Wait before next update
-                await asyncio.sleep(1)
+                event_data = job_event_data(job)
+                yield f"data: {json.dumps(event_data)}\n\n"
+                
+                # If processing is complete, close the stream
+                if event_data["is_complete"]:
+                    break
         
         except asyncio.CancelledError:
             # Client disconnected
@@ -480,6 +576,10 @@ async def stream_processing_progress(
             logger.error(f"Error in SSE stream for document {document_id}: {str(e)}")
             # Send error event
             yield f"data: {json.dumps({'error': str(e)})}\n\n"
+        finally:
+            if pubsub is not None:
+                await pubsub.unsubscribe()
+                await pubsub.close()
     
     return StreamingResponse(
         event_generator(),
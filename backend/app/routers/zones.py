@@ -3,7 +3,8 @@ Zone management API endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List, Optional
+from fastapi.responses import StreamingResponse
+from typing import AsyncGenerator, List, Optional
 from uuid import UUID
 import logging
 
@@ -83,6 +84,30 @@ async def get_document_zones(
             detail=f"Failed to retrieve zones: {str(e)}"
         )
 
+@router.get("/documents/{document_id}/zones/stream")
+async def stream_document_zones(
+    document_id: UUID,
+    zone_type: Optional[ZoneType] = Query(None, description="Filter by zone type"),
+    status: Optional[ZoneStatus] = Query(None, description="Filter by status"),
+    page_number: Optional[int] = Query(None, ge=1, description="Filter by page number"),
+    zone_service: ZoneService = Depends(get_zone_service)
+):
+    """
+    Stream a document's zones as newline-delimited JSON
+    
+    - **document_id**: Document UUID
+    - **zone_type** / **status** / **page_number**: Optional filters
+    - Returns one zone object per line, sent as rows arrive from the database,
+      so large documents are never held in memory as a whole
+    """
+    async def zone_lines() -> AsyncGenerator[str, None]:
+        async for zone in zone_service.iter_zones_by_document(
+            document_id, zone_type, status, page_number
+        ):
+            yield zone.model_dump_json() + "\n"
+    
+    return StreamingResponse(zone_lines(), media_type="application/x-ndjson")
+
 @router.post("/documents/{document_id}/zones")
 async def create_zone(
     document_id: UUID,
@@ -29,6 +29,10 @@ from app.middleware.errors import DocumentNotFoundError, StorageError
 
 logger = logging.getLogger(__name__)
 
+# Redis set of document ids known to exist; only positive lookups are cached,
+# so the sole invalidation needed is removal on delete
+KNOWN_DOCUMENTS_KEY = "docs:known"
+
 class DocumentService:
     """Service for document management operations"""
     
@@ -368,6 +372,10 @@ class DocumentService:
                 # Invalidate cache
                 if self.redis_client:
                     await self._invalidate_document_cache(document_id)
+                    try:
+                        await self.redis_client.srem(KNOWN_DOCUMENTS_KEY, str(document_id))
+                    except Exception as e:
+                        logger.warning(f"Failed to drop known document {document_id}: {e}")
                 
                 return "DELETE 1" in result
         
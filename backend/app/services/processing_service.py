@@ -3,9 +3,13 @@ Processing service for managing document processing jobs and workflows
 """
 
 import uuid
+import json
 import asyncpg
-from datetime import datetime
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+import functools
 import logging
+from typing import Callable, List, Optional, Dict, Any, Tuple
 
 try:
     import redis.asyncio as redis
@@ -19,6 +23,14 @@ except ImportError:
     REDIS_AVAILABLE = False
     SUPABASE_AVAILABLE = False
 
+try:
+    from arq.connections import ArqRedis
+    ARQ_AVAILABLE = True
+except ImportError:
+    # Without arq, jobs run in-process via FastAPI BackgroundTasks
+    ArqRedis = Any
+    ARQ_AVAILABLE = False
+
 import httpx
 import asyncio
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
@@ -28,13 +40,14 @@ import tempfile
 import os
 from pathlib import Path
 
-from typing import List, Optional, Dict, Any
 from fastapi import BackgroundTasks
 from app.models.processing import (
     ProcessingRequest, ProcessingResponse, ProcessingStatus, 
     ZoneUpdate, ZoneResponse, ProcessingStatsResponse
 )
-from app.models.base import PaginatedResponse
+from app.models.base import PaginatedResponse, CursorPaginatedResponse
+from app.middleware.errors import InvalidCursorError, ZoneNotFoundError
+from app.services.document_service import KNOWN_DOCUMENTS_KEY
 
 # For demo mode - create a simple ProcessingHistory type if not available
 try:
@@ -45,16 +58,290 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Redis keys for short-lived aggregate caches
+ACTIVE_JOBS_CACHE_KEY = "proc:active_jobs:v1"
+STATS_CACHE_TTL = 5  # seconds
+
+# Redis hash of running job counters, bumped on each status transition so stats
+# reads never aggregate over processing_jobs. The "seeded" field marks a hash
+# that was initialised from the table; while one reader is seeding it (the
+# "seeding" field holds its token), increments collect in "pending:" fields.
+STATS_COUNTERS_KEY = "proc:counters"
+
+# The seeded hash expires and is rebuilt from the table this often (seconds),
+# which reconciles any drift (e.g. the active count) and drops the day/week/
+# month fields of past periods
+STATS_COUNTERS_TTL = 3600
+
+# A seed that has not finished within this many seconds is abandoned, so a
+# crashed seeder cannot block the next one
+STATS_COUNTERS_SEED_TIMEOUT = 60
+
+# Apply HINCRBY/HINCRBYFLOAT triples (field, amount, "i"|"f") atomically. A
+# seeded hash takes them directly; during a seed they are parked as pending
+# deltas; with no hash at all the table is the source of truth and they are
+# dropped
+_INCR_SEEDED_COUNTERS = """
+local prefix
+if redis.call('HEXISTS', KEYS[1], 'seeded') == 1 then
+    prefix = ''
+elseif redis.call('HEXISTS', KEYS[1], 'seeding') == 1 then
+    prefix = 'pending:'
+else
+    return 0
+end
+for i = 1, #ARGV, 3 do
+    if ARGV[i + 2] == 'f' then
+        redis.call('HINCRBYFLOAT', KEYS[1], prefix .. ARGV[i], ARGV[i + 1])
+    else
+        redis.call('HINCRBY', KEYS[1], prefix .. ARGV[i], ARGV[i + 1])
+    end
+end
+return 1
+"""
+
+# Claim the seed of a missing counters hash. ARGV: token, timeout
+_BEGIN_COUNTERS_SEED = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+redis.call('HSET', KEYS[1], 'seeding', ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+# Finish a claimed seed: store the table snapshot, fold in the deltas that
+# arrived since the claim, and mark the hash seeded. ARGV: token, TTL, then
+# field/value pairs
+_FINISH_COUNTERS_SEED = """
+if redis.call('HGET', KEYS[1], 'seeding') ~= ARGV[1] then
+    return 0
+end
+local pending = redis.call('HGETALL', KEYS[1])
+for i = 3, #ARGV, 2 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+for i = 1, #pending, 2 do
+    local field = pending[i]
+    if string.sub(field, 1, 8) == 'pending:' then
+        redis.call('HINCRBYFLOAT', KEYS[1], string.sub(field, 9), pending[i + 1])
+        redis.call('HDEL', KEYS[1], field)
+    end
+end
+redis.call('HDEL', KEYS[1], 'seeding')
+redis.call('HSET', KEYS[1], 'seeded', 1)
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+def _counter_periods(ts: datetime) -> Dict[str, str]:
+    """Counter fields for the day/week/month containing ts"""
+    year, week, _ = ts.isocalendar()
+    return {
+        "today": f"today:{ts:%Y-%m-%d}",
+        "week": f"week:{year}-W{week:02d}",
+        "month": f"month:{ts:%Y-%m}",
+    }
+
+# Fixed zone UPDATE text so every call hits asyncpg's prepared-statement cache;
+# NULL parameters leave the column unchanged
+UPDATE_ZONE_SQL = """
+    UPDATE zones 
+    SET zone_type = COALESCE($1, zone_type),
+        content = COALESCE($2, content),
+        confidence = COALESCE($3, confidence),
+        status = COALESCE($4, status),
+        updated_at = $5
+    WHERE id = $6
+    RETURNING *
+"""
+
+# The same update for a batch of one document's zones: each field arrives as an
+# array with one entry per zone, and RETURNING reports which zones matched
+BULK_UPDATE_ZONE_SQL = """
+    UPDATE zones AS z
+    SET zone_type = COALESCE(u.zone_type::zone_type, z.zone_type),
+        content = COALESCE(u.content, z.content),
+        confidence = COALESCE(u.confidence, z.confidence),
+        status = COALESCE(u.status::zone_status, z.status),
+        updated_at = $6
+    FROM UNNEST($1::uuid[], $2::text[], $3::text[], $4::float8[], $5::text[])
+        AS u(id, zone_type, content, confidence, status)
+    WHERE z.id = u.id AND z.document_id = $7
+    RETURNING z.id
+"""
+
+# Demo-mode job fields that are the same for every call; _demo_job adds the
+# per-call id, document and timestamps
+_DEMO_JOB_FIELDS = {
+    "status": ProcessingStatus.COMPLETED,
+    "strategy": "hi_res_gpu_demo",
+    "progress": 100.0,
+    "total_zones": 5,
+    "completed_zones": 5,
+    "failed_zones": 0,
+    "success_rate": 100.0,
+    "confidence_score": 0.92,
+    "processing_time": 2.5,
+    "demo_mode": True,
+}
+
+# Progress writes only land while the job is still processing, so a late flush
+# can never overwrite the terminal state written by _finalize_job
+UPDATE_JOB_PROGRESS_SQL = """
+    UPDATE processing_jobs 
+    SET progress = $1, updated_at = $2
+    WHERE id = $3 AND status = 'processing'
+"""
+PROGRESS_FLUSH_INTERVAL = 0.25  # seconds
+
+# Redis pub/sub channels carrying live job progress (see app.websocket.progress.ProgressRelay)
+PROGRESS_CHANNEL_PATTERN = "job:*:progress"
+
+# Postgres NOTIFY channel used for the same events when Redis is not deployed
+PROGRESS_NOTIFY_CHANNEL = "job_progress"
+
+def progress_channel(job_id: uuid.UUID) -> str:
+    """Redis channel that carries progress events for a job"""
+    return f"job:{job_id}:progress"
+
+class ProgressCoalescer:
+    """
+    Buffers the latest progress value per job and writes them in one batch.
+    
+    Workers report progress far more often than anyone needs it persisted; only the
+    newest value per job survives each flush window, turning bursts of UPDATEs into
+    a single executemany.
+    """
+    
+    _instances: Dict[int, "ProgressCoalescer"] = {}
+    
+    def __init__(self, db_pool: asyncpg.Pool, flush_interval: float = PROGRESS_FLUSH_INTERVAL):
+        self.db_pool = db_pool
+        self.flush_interval = flush_interval
+        self._pending: Dict[uuid.UUID, Tuple[float, datetime]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    @classmethod
+    def for_pool(cls, db_pool: asyncpg.Pool) -> "ProgressCoalescer":
+        """Get the coalescer shared by every service using this pool"""
+        coalescer = cls._instances.get(id(db_pool))
+        if coalescer is None or coalescer.db_pool is not db_pool:
+            coalescer = cls._instances[id(db_pool)] = cls(db_pool)
+        return coalescer
+    
+    def submit(self, job_id: uuid.UUID, progress: float):
+        """Record the latest progress for a job and schedule a flush"""
+        self._pending[job_id] = (progress, datetime.utcnow())
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+    
+    def discard(self, job_id: uuid.UUID):
+        """Drop any buffered progress for a job that has reached a terminal state"""
+        self._pending.pop(job_id, None)
+    
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+        # Progress submitted while the write was in flight saw this task still
+        # running and scheduled nothing; give it its own window
+        if self._pending:
+            self._flush_task = asyncio.create_task(self._flush_later())
+    
+    async def flush(self):
+        """Write all buffered progress values"""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        rows = [
+            (progress, updated_at, job_id)
+            for job_id, (progress, updated_at) in pending.items()
+        ]
+        try:
+            async with self.db_pool.acquire() as conn:
+                # Progress ticks are advisory; terminal state is written by _finalize_job,
+                # so skip the WAL flush wait for these high-frequency writes
+                async with conn.transaction():
+                    await conn.execute("SET LOCAL synchronous_commit = off")
+                    await conn.executemany(UPDATE_JOB_PROGRESS_SQL, rows)
+        except Exception as e:
+            logger.error(f"Error flushing progress for {len(rows)} jobs: {e}")
+
+def _demo_job(document_id: uuid.UUID, **updates) -> ProcessingResponse:
+    """Build a demo job for a document from the precomputed fields"""
+    now = datetime.utcnow()
+    # model_construct skips validation: the demo strategy is not a ProcessingStrategy
+    return ProcessingResponse.model_construct(**{
+        **_DEMO_JOB_FIELDS,
+        "id": uuid.uuid4(),
+        "document_id": document_id,
+        "options": {"demo_mode": True},
+        "created_at": now,
+        "updated_at": now,
+        "started_at": now,
+        "completed_at": now,
+        "duration": 0.0,
+        **updates
+    })
+
+def _demo_stats() -> ProcessingStatsResponse:
+    """Processing statistics for demo mode, which has no jobs"""
+    return ProcessingStatsResponse(
+        total_jobs=0,
+        active_jobs=0,
+        completed_jobs=0,
+        failed_jobs=0,
+        total_zones_processed=0,
+        success_rate=0.0,
+        jobs_today=0,
+        jobs_this_week=0,
+        jobs_this_month=0
+    )
+
+def db_required(
+    demo_factory: Optional[Callable[..., Any]] = None,
+    error_factory: Optional[Callable[..., Any]] = None
+):
+    """
+    Decorator for service methods that talk to the database.
+    
+    - **demo_factory**: called with the method arguments when no pool is configured;
+      the method body is skipped entirely
+    - **error_factory**: called with the exception and the method arguments to build a
+      fallback result; when omitted the exception is re-raised
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            if self.db_pool is None and demo_factory is not None:
+                return demo_factory(*args, **kwargs)
+            try:
+                return await func(self, *args, **kwargs)
+            except Exception as e:
+                logger.error(f"Error in {func.__name__}: {e}")
+                if error_factory is None:
+                    raise
+                return error_factory(e, *args, **kwargs)
+        return wrapper
+    return decorator
+
 class ProcessingService:
     def __init__(
         self, 
         db_pool: Optional[asyncpg.Pool] = None,
         supabase_client: Optional[Client] = None,
-        redis_client: Optional[redis.Redis] = None
+        redis_client: Optional[redis.Redis] = None,
+        arq_pool: Optional[ArqRedis] = None,
+        db_pool_read: Optional[asyncpg.Pool] = None
     ):
+        # Writes go through db_pool; SELECTs use db_pool_read so long-running
+        # UPDATEs cannot starve dashboard reads (falls back to the write pool)
         self.db_pool = db_pool
+        self.db_pool_read = db_pool_read or db_pool
         self.supabase_client = supabase_client if SUPABASE_AVAILABLE else None
         self.redis_client = redis_client if REDIS_AVAILABLE else None
+        self.arq_pool = arq_pool if ARQ_AVAILABLE else None
+        self._progress = ProgressCoalescer.for_pool(db_pool) if db_pool is not None else None
         
         # Log the initialization state
         if db_pool is None:
@@ -62,166 +349,179 @@ class ProcessingService:
         else:
             logger.info("ProcessingService initialized with database connection")
     
-    async def document_exists(self, document_id: uuid.UUID) -> bool:
+    @asynccontextmanager
+    async def _conn(self, conn: Optional[asyncpg.Connection] = None):
+        """Yield the caller's connection if given, otherwise acquire one from the pool.
+        
+        Lets a multi-step workflow run all its queries over one acquire (and one
+        prepared-statement cache) while each step still works on its own.
+        """
+        if conn is not None:
+            yield conn
+        else:
+            async with self.db_pool.acquire() as acquired:
+                yield acquired
+    
+    @db_required(
+        demo_factory=lambda document_id, conn=None: True,
+        error_factory=lambda e, document_id, conn=None: True
+    )
+    async def document_exists(
+        self,
+        document_id: uuid.UUID,
+        conn: Optional[asyncpg.Connection] = None
+    ) -> bool:
         """Check if document exists"""
-        try:
-            # Check if database is available
-            if self.db_pool is None:
-                logger.info("Database not available - assuming document exists in demo mode")
-                return True
-                
-            async with self.db_pool.acquire() as conn:
-                row = await conn.fetchrow("""
-                    SELECT id FROM documents WHERE id = $1
-                """, document_id)
-            return row is not None
-        except Exception as e:
-            logger.error(f"Error checking document existence: {e}")
-            # In demo mode, assume document exists
-            return True
+        if self.redis_client:
+            try:
+                if await self.redis_client.sismember(KNOWN_DOCUMENTS_KEY, str(document_id)):
+                    return True
+            except Exception as e:
+                logger.warning(f"Known-document lookup failed for {document_id}: {e}")
+        
+        if conn is not None:
+            row = await conn.fetchrow("SELECT id FROM documents WHERE id = $1", document_id)
+        else:
+            async with self.db_pool_read.acquire() as conn:
+                row = await conn.fetchrow("SELECT id FROM documents WHERE id = $1", document_id)
+        
+        if row is None:
+            return False
+        if self.redis_client:
+            try:
+                await self.redis_client.sadd(KNOWN_DOCUMENTS_KEY, str(document_id))
+            except Exception as e:
+                logger.warning(f"Failed to cache known document {document_id}: {e}")
+        return True
     
+    @db_required(demo_factory=lambda document_id: None, error_factory=lambda e, document_id: None)
     async def get_active_job(self, document_id: uuid.UUID) -> Optional[ProcessingResponse]:
         """Get active processing job for document"""
-        try:
-            # Check if database is available
-            if self.db_pool is None:
-                logger.info("Database not available - no active jobs in demo mode")
-                return None
-                
-            async with self.db_pool.acquire() as conn:
-                row = await conn.fetchrow("""
-                    SELECT * FROM processing_jobs 
-                    WHERE document_id = $1 AND status IN ('queued', 'processing')
-                    ORDER BY created_at DESC LIMIT 1
-                """, document_id)
-            
-            if row:
-                return ProcessingResponse(**dict(row))
-            return None
-        except Exception as e:
-            logger.error(f"Error getting active job for document {document_id}: {e}")
-            return None
+        async with self.db_pool_read.acquire() as conn:
+            row = await conn.fetchrow("""
+                SELECT * FROM processing_jobs 
+                WHERE document_id = $1 AND status IN ('queued', 'processing')
+                ORDER BY created_at DESC LIMIT 1
+            """, document_id)
+        
+        if row:
+            return ProcessingResponse.from_record(row)
+        return None
     
+    @db_required(demo_factory=lambda: 0, error_factory=lambda e: 0)
     async def get_active_jobs_count(self) -> int:
         """Get count of active processing jobs"""
-        try:
-            # Check if database is available
-            if self.db_pool is None:
-                logger.info("Database not available - returning 0 active jobs in demo mode")
-                return 0
-                
-            async with self.db_pool.acquire() as conn:
-                row = await conn.fetchrow("""
-                    SELECT COUNT(*) as count FROM processing_jobs 
-                    WHERE status IN ('queued', 'processing')
-                """)
-            
-            return row['count'] if row else 0
-        except Exception as e:
-            logger.error(f"Error getting active jobs count: {e}")
-            return 0
+        if self.redis_client:
+            try:
+                active, seeded = await self.redis_client.hmget(STATS_COUNTERS_KEY, "active", "seeded")
+                if active is not None and seeded is not None:
+                    return max(int(active), 0)
+            except Exception as e:
+                logger.warning(f"Failed to read active job counter: {e}")
+        
+        cached = await self._cache_get(ACTIVE_JOBS_CACHE_KEY)
+        if cached is not None:
+            return int(cached)
+        
+        async with self.db_pool_read.acquire() as conn:
+            row = await conn.fetchrow("""
+                SELECT COUNT(*) as count FROM processing_jobs 
+                WHERE status IN ('queued', 'processing')
+            """)
+        
+        count = row['count'] if row else 0
+        await self._cache_set(ACTIVE_JOBS_CACHE_KEY, str(count))
+        return count
     
+    @db_required()
     async def create_processing_job(
         self, 
         document_id: uuid.UUID, 
-        request: ProcessingRequest
+        request: ProcessingRequest,
+        conn: Optional[asyncpg.Connection] = None
     ) -> ProcessingResponse:
         """Create a new processing job"""
-        try:
-            job_id = uuid.uuid4()
-            now = datetime.utcnow()
-            
-            async with self.db_pool.acquire() as conn:
-                row = await conn.fetchrow("""
-                    INSERT INTO processing_jobs (
-                        id, document_id, status, strategy, progress,
-                        total_zones, completed_zones, failed_zones,
-                        options, created_at, updated_at
-                    ) VALUES (
-                        $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11
-                    ) RETURNING *
-                """, 
-                    job_id, document_id, ProcessingStatus.QUEUED, 
-                    request.strategy, 0.0, 0, 0, 0,
-                    request.options, now, now
+        job_id = uuid.uuid4()
+        now = datetime.utcnow()
+        
+        async with self._conn(conn) as conn:
+            await conn.execute("""
+                INSERT INTO processing_jobs (
+                    id, document_id, status, strategy, progress,
+                    total_zones, completed_zones, failed_zones,
+                    options, created_at, updated_at
+                ) VALUES (
+                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11
                 )
-            
-            return ProcessingResponse(**dict(row))
-        except Exception as e:
-            logger.error(f"Error creating processing job: {e}")
-            raise
+            """, 
+                job_id, document_id, ProcessingStatus.QUEUED, 
+                request.strategy, 0.0, 0, 0, 0,
+                request.options, now, now
+            )
+        
+        await self._invalidate_stats_cache()
+        await self._incr_counters({
+            "total": 1,
+            "active": 1,
+            **{field: 1 for field in _counter_periods(now).values()}
+        })
+        
+        # Every column of the new row is known locally, so skip RETURNING *
+        return ProcessingResponse(
+            id=job_id,
+            document_id=document_id,
+            status=ProcessingStatus.QUEUED,
+            strategy=request.strategy,
+            progress=0.0,
+            total_zones=0,
+            completed_zones=0,
+            failed_zones=0,
+            options=request.options,
+            created_at=now,
+            updated_at=now,
+            success_rate=100.0
+        )
     
+    @db_required(
+        demo_factory=_demo_job,
+        error_factory=lambda e, document_id: _demo_job(
+            document_id,
+            total_zones=3,
+            completed_zones=3,
+            started_at=None,
+            completed_at=None,
+            duration=None,
+            options={"demo_mode": True, "error": str(e)}
+        )
+    )
     async def get_latest_job(self, document_id: uuid.UUID) -> Optional[ProcessingResponse]:
         """Get latest processing job for document"""
-        try:
-            # Check if database is available
-            if self.db_pool is None:
-                logger.info("Database not available - returning demo processing job")
-                job_id = uuid.uuid4()
-                
-                return ProcessingResponse(
-                    id=job_id,
-                    document_id=document_id,
-                    status=ProcessingStatus.COMPLETED,
-                    strategy="hi_res_gpu_demo",
-                    progress=100.0,
-                    total_zones=5,
-                    completed_zones=5,
-                    failed_zones=0,
-                    options={"demo_mode": True},
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
-                    started_at=datetime.utcnow(),
-                    completed_at=datetime.utcnow(),
-                    confidence_score=0.92,
-                    processing_time=2.5,
-                    demo_mode=True
-                )
-                
-            async with self.db_pool.acquire() as conn:
-                row = await conn.fetchrow("""
-                    SELECT * FROM processing_jobs 
-                    WHERE document_id = $1 
-                    ORDER BY created_at DESC LIMIT 1
-                """, document_id)
-            
-            if row:
-                return ProcessingResponse(**dict(row))
-            return None
-        except Exception as e:
-            logger.error(f"Error getting latest job for document {document_id}: {e}")
-            # Return demo job on error
-            job_id = uuid.uuid4()
-            
-            return ProcessingResponse(
-                id=job_id,
-                document_id=document_id,
-                status=ProcessingStatus.COMPLETED,
-                strategy="hi_res_gpu_demo",
-                progress=100.0,
-                total_zones=3,
-                completed_zones=3,
-                failed_zones=0,
-                options={"demo_mode": True, "error": str(e)},
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-                demo_mode=True
-            )
+        async with self.db_pool_read.acquire() as conn:
+            row = await conn.fetchrow("""
+                SELECT * FROM processing_jobs 
+                WHERE document_id = $1 
+                ORDER BY created_at DESC LIMIT 1
+            """, document_id)
+        
+        if row:
+            return ProcessingResponse.from_record(row)
+        return None
     
+    @db_required(error_factory=lambda e, document_id: False)
     async def cancel_processing(self, document_id: uuid.UUID) -> bool:
         """Cancel active processing for document"""
-        try:
-            async with self.db_pool.acquire() as conn:
-                result = await conn.execute("""
-                    UPDATE processing_jobs 
-                    SET status = $1, updated_at = $2
-                    WHERE document_id = $3 AND status IN ('queued', 'processing')
-                """, ProcessingStatus.CANCELLED, datetime.utcnow(), document_id)
-            
-            return "UPDATE" in result and not result.endswith("0")
-        except Exception as e:
-            logger.error(f"Error cancelling processing for document {document_id}: {e}")
-            return False
+        async with self.db_pool.acquire() as conn:
+            result = await conn.execute("""
+                UPDATE processing_jobs 
+                SET status = $1, updated_at = $2
+                WHERE document_id = $3 AND status IN ('queued', 'processing')
+            """, ProcessingStatus.CANCELLED, datetime.utcnow(), document_id)
+        
+        await self._invalidate_stats_cache()
+        cancelled = int(result.split()[-1]) if result.startswith("UPDATE") else 0
+        if cancelled:
+            await self._incr_counters({"active": -cancelled})
+        return cancelled > 0
     
     async def retry_processing(
         self, 
@@ -233,12 +533,14 @@ class ProcessingService:
         # Stub implementation
         try:
             processing_request = ProcessingRequest(strategy="auto")
-            job = await self.create_processing_job(document_id, processing_request)
+            async with self._conn() as conn:
+                if not await self.document_exists(document_id, conn=conn):
+                    return None
+                job = await self.create_processing_job(document_id, processing_request, conn=conn)
             
             # Queue for background processing
-            background_tasks.add_task(
-                self.process_document_background,
-                job.id, document_id, processing_request
+            await self.enqueue_processing(
+                job.id, document_id, processing_request, background_tasks
             )
             
             return job
@@ -246,6 +548,7 @@ class ProcessingService:
             logger.error(f"Error retrying processing for document {document_id}: {e}")
             return None
     
+    @db_required(error_factory=lambda e, document_id, filters=None: [])
     async def get_document_zones(
         self, 
         document_id: uuid.UUID, 
@@ -253,31 +556,28 @@ class ProcessingService:
     ) -> List[ZoneResponse]:
         """Get zones for document"""
         # Stub implementation
-        try:
-            async with self.db_pool.acquire() as conn:
-                # Build query with filters
-                query = "SELECT * FROM zones WHERE document_id = $1"
-                params = [document_id]
-                
-                if filters:
-                    if filters.get("page_number"):
-                        query += " AND page_number = $2"
-                        params.append(filters["page_number"])
-                    if filters.get("zone_type"):
-                        query += f" AND zone_type = ${len(params) + 1}"
-                        params.append(filters["zone_type"])
-                    if filters.get("status"):
-                        query += f" AND status = ${len(params) + 1}"
-                        params.append(filters["status"])
-                
-                query += " ORDER BY zone_index"
-                rows = await conn.fetch(query, *params)
+        async with self.db_pool_read.acquire() as conn:
+            # Build query with filters
+            query = "SELECT * FROM zones WHERE document_id = $1"
+            params = [document_id]
             
-            return [ZoneResponse(**dict(row)) for row in rows]
-        except Exception as e:
-            logger.error(f"Error getting zones for document {document_id}: {e}")
-            return []
+            if filters:
+                if filters.get("page_number"):
+                    query += " AND page_number = $2"
+                    params.append(filters["page_number"])
+                if filters.get("zone_type"):
+                    query += f" AND zone_type = ${len(params) + 1}"
+                    params.append(filters["zone_type"])
+                if filters.get("status"):
+                    query += f" AND status = ${len(params) + 1}"
+                    params.append(filters["status"])
+            
+            query += " ORDER BY zone_index"
+            rows = await conn.fetch(query, *params)
+        
+        return [ZoneResponse.from_record(row) for row in rows]
     
+    @db_required(error_factory=lambda e, document_id, zone_id, zone_update: None)
     async def update_zone(
         self, 
         document_id: uuid.UUID, 
@@ -286,150 +586,287 @@ class ProcessingService:
     ) -> Optional[ZoneResponse]:
         """Update zone information"""
         # Stub implementation
-        try:
-            update_fields = []
-            update_values = []
-            param_count = 1
-            
-            if zone_update.zone_type is not None:
-                update_fields.append(f"zone_type = ${param_count}")
-                update_values.append(zone_update.zone_type)
-                param_count += 1
-            
-            if zone_update.content is not None:
-                update_fields.append(f"content = ${param_count}")
-                update_values.append(zone_update.content)
-                param_count += 1
-            
-            if zone_update.confidence is not None:
-                update_fields.append(f"confidence = ${param_count}")
-                update_values.append(zone_update.confidence)
-                param_count += 1
-            
-            if zone_update.status is not None:
-                update_fields.append(f"status = ${param_count}")
-                update_values.append(zone_update.status)
-                param_count += 1
-            
-            if not update_fields:
-                return None
-            
-            update_fields.append(f"updated_at = ${param_count}")
-            update_values.append(datetime.utcnow())
-            param_count += 1
-            
-            update_values.append(zone_id)
-            
-            query = f"""
-                UPDATE zones 
-                SET {', '.join(update_fields)}
-                WHERE id = ${param_count}
-                RETURNING *
-            """
-            
-            async with self.db_pool.acquire() as conn:
-                row = await conn.fetchrow(query, *update_values)
-            
-            if row:
-                return ZoneResponse(**dict(row))
+        params = self._zone_update_params(zone_id, zone_update, datetime.utcnow())
+        if params is None:
             return None
-        except Exception as e:
-            logger.error(f"Error updating zone {zone_id}: {e}")
+        
+        async with self.db_pool.acquire() as conn:
+            row = await conn.fetchrow(UPDATE_ZONE_SQL, *params)
+        
+        if row:
+            return ZoneResponse.from_record(row)
+        return None
+    
+    @db_required(demo_factory=lambda document_id, updates: 0)
+    async def bulk_update_zones(
+        self,
+        document_id: uuid.UUID,
+        updates: List[Tuple[uuid.UUID, ZoneUpdate]]
+    ) -> int:
+        """
+        Apply many updates to a document's zones in one statement
+        
+        Returns the number of zones updated. If any zone is not part of the
+        document, raises ZoneNotFoundError and nothing is updated.
+        """
+        # A zone listed more than once takes its last update
+        by_zone = dict(updates)
+        if not by_zone:
+            return 0
+        
+        zone_updates = by_zone.values()
+        async with self.db_pool.acquire() as conn:
+            async with conn.transaction():
+                rows = await conn.fetch(
+                    BULK_UPDATE_ZONE_SQL,
+                    list(by_zone),
+                    [zone_update.zone_type for zone_update in zone_updates],
+                    [zone_update.content for zone_update in zone_updates],
+                    [zone_update.confidence for zone_update in zone_updates],
+                    [zone_update.status for zone_update in zone_updates],
+                    datetime.utcnow(),
+                    document_id
+                )
+                missing = by_zone.keys() - {row["id"] for row in rows}
+                if missing:
+                    # Raising inside the transaction rolls back the zones that matched
+                    raise ZoneNotFoundError(", ".join(sorted(map(str, missing))))
+        
+        return len(rows)
+    
+    @staticmethod
+    def _zone_update_params(
+        zone_id: uuid.UUID,
+        zone_update: ZoneUpdate,
+        now: datetime
+    ) -> Optional[tuple]:
+        """Bind a ZoneUpdate to UPDATE_ZONE_SQL parameters, or None if nothing changes"""
+        values = (
+            zone_update.zone_type,
+            zone_update.content,
+            zone_update.confidence,
+            zone_update.status
+        )
+        if all(value is None for value in values):
             return None
+        return (*values, now, zone_id)
     
+    @db_required()
     async def list_processing_jobs(
         self,
         page: int = 1,
         size: int = 20,
-        filters: Dict[str, Any] = None
-    ) -> PaginatedResponse[ProcessingResponse]:
-        """List processing jobs with pagination"""
+        filters: Dict[str, Any] = None,
+        cursor: Optional[str] = None,
+        keyset: bool = False
+    ) -> PaginatedResponse[ProcessingResponse] | CursorPaginatedResponse[ProcessingResponse]:
+        """
+        List processing jobs with pagination
+        
+        OFFSET paging (page/size) is the default. Passing a cursor, or keyset=True for
+        the first page, switches to keyset paging on (created_at, id), which costs
+        O(size) per page regardless of depth and skips the COUNT(*).
+        """
         # Stub implementation
-        try:
-            filters = filters or {}
-            offset = (page - 1) * size
-            
-            where_conditions = []
-            where_values = []
-            param_count = 1
-            
-            if filters.get("status"):
-                where_conditions.append(f"status = ${param_count}")
-                where_values.append(filters["status"])
-                param_count += 1
-            
-            if filters.get("document_id"):
-                where_conditions.append(f"document_id = ${param_count}")
-                where_values.append(filters["document_id"])
-                param_count += 1
-            
-            where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
+        filters = filters or {}
+        offset = (page - 1) * size
+        
+        where_conditions = []
+        where_values = []
+        param_count = 1
+        
+        if filters.get("status"):
+            where_conditions.append(f"status = ${param_count}")
+            where_values.append(filters["status"])
+            param_count += 1
+        
+        if filters.get("document_id"):
+            where_conditions.append(f"document_id = ${param_count}")
+            where_values.append(filters["document_id"])
+            param_count += 1
+        
+        if cursor or keyset:
+            return await self._list_processing_jobs_keyset(
+                size, cursor, where_conditions, where_values
+            )
+        
+        where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
+        
+        async with self.db_pool_read.acquire() as conn:
+            # Get jobs and the total count in one round trip
+            jobs_query = f"""
+                SELECT *, COUNT(*) OVER() AS _total FROM processing_jobs 
+                {where_clause}
+                ORDER BY created_at DESC
+                LIMIT ${param_count} OFFSET ${param_count + 1}
+            """
+            rows = await conn.fetch(jobs_query, *where_values, size, offset)
             
-            async with self.db_pool.acquire() as conn:
-                # Get total count
+            if rows:
+                total = rows[0]["_total"]
+            elif offset:
+                # Past the last page there is no row to carry the count
                 count_query = f"SELECT COUNT(*) FROM processing_jobs {where_clause}"
                 total = await conn.fetchval(count_query, *where_values)
-                
-                # Get jobs
-                jobs_query = f"""
-                    SELECT * FROM processing_jobs 
-                    {where_clause}
-                    ORDER BY created_at DESC
-                    LIMIT ${param_count} OFFSET ${param_count + 1}
-                """
-                where_values.extend([size, offset])
-                
-                rows = await conn.fetch(jobs_query, *where_values)
-            
-            jobs = [ProcessingResponse(**dict(row)) for row in rows]
-            total_pages = (total + size - 1) // size
-            
-            return PaginatedResponse(
-                items=jobs,
-                total=total,
-                page=page,
-                size=size,
-                pages=total_pages,
-                has_next=page < total_pages,
-                has_prev=page > 1
-            )
-        except Exception as e:
-            logger.error(f"Error listing processing jobs: {e}")
-            raise
+            else:
+                total = 0
+        
+        jobs = [ProcessingResponse.from_record(row) for row in rows]
+        total_pages = (total + size - 1) // size
+        
+        return PaginatedResponse(
+            items=jobs,
+            total=total,
+            page=page,
+            size=size,
+            pages=total_pages,
+            has_next=page < total_pages,
+            has_prev=page > 1
+        )
     
+    async def _list_processing_jobs_keyset(
+        self,
+        size: int,
+        cursor: Optional[str],
+        where_conditions: List[str],
+        where_values: List[Any]
+    ) -> CursorPaginatedResponse[ProcessingResponse]:
+        """Keyset page of processing jobs ordered by (created_at, id) descending"""
+        where_conditions = list(where_conditions)
+        where_values = list(where_values)
+        
+        if cursor:
+            cursor_created_at, cursor_id = self._decode_job_cursor(cursor)
+            param_count = len(where_values) + 1
+            where_conditions.append(f"(created_at, id) < (${param_count}, ${param_count + 1})")
+            where_values.extend([cursor_created_at, cursor_id])
+        
+        where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
+        
+        # Fetch one extra row to learn whether another page exists
+        jobs_query = f"""
+            SELECT * FROM processing_jobs 
+            {where_clause}
+            ORDER BY created_at DESC, id DESC
+            LIMIT ${len(where_values) + 1}
+        """
+        
+        async with self.db_pool_read.acquire() as conn:
+            rows = await conn.fetch(jobs_query, *where_values, size + 1)
+        
+        has_next = len(rows) > size
+        rows = rows[:size]
+        
+        return CursorPaginatedResponse(
+            items=[ProcessingResponse.from_record(row) for row in rows],
+            size=size,
+            next_cursor=self._encode_job_cursor(rows[-1]) if has_next else None,
+            has_next=has_next
+        )
+    
+    @staticmethod
+    def _encode_job_cursor(row) -> str:
+        """Encode the keyset position of a processing_jobs row"""
+        return f"{row['created_at'].isoformat()}|{row['id']}"
+    
+    @staticmethod
+    def _decode_job_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+        """Decode a cursor produced by _encode_job_cursor"""
+        try:
+            created_at, job_id = cursor.split("|", 1)
+            return datetime.fromisoformat(created_at), uuid.UUID(job_id)
+        except ValueError:
+            raise InvalidCursorError(cursor)
+    
+    @db_required(demo_factory=_demo_stats)
     async def get_processing_stats(self) -> ProcessingStatsResponse:
         """Get processing statistics"""
-        # Stub implementation
-        try:
-            async with self.db_pool.acquire() as conn:
-                stats_row = await conn.fetchrow("""
-                    SELECT 
-                        COUNT(*) as total_jobs,
-                        COUNT(CASE WHEN status IN ('queued', 'processing') THEN 1 END) as active_jobs,
-                        COUNT(CASE WHEN status = 'completed' THEN 1 END) as completed_jobs,
-                        COUNT(CASE WHEN status = 'failed' THEN 1 END) as failed_jobs,
-                        AVG(EXTRACT(EPOCH FROM (completed_at - started_at))) as avg_processing_time,
-                        SUM(total_zones) as total_zones_processed,
-                        AVG(total_zones) as avg_zones_per_job
-                    FROM processing_jobs
-                """)
-            
-            return ProcessingStatsResponse(
-                total_jobs=stats_row["total_jobs"] or 0,
-                active_jobs=stats_row["active_jobs"] or 0,
-                completed_jobs=stats_row["completed_jobs"] or 0,
-                failed_jobs=stats_row["failed_jobs"] or 0,
-                average_processing_time=stats_row["avg_processing_time"],
-                total_zones_processed=stats_row["total_zones_processed"] or 0,
-                average_zones_per_job=stats_row["avg_zones_per_job"],
-                success_rate=0.0,  # Calculate based on completed vs failed
-                jobs_today=0,
-                jobs_this_week=0,
-                jobs_this_month=0
-            )
-        except Exception as e:
-            logger.error(f"Error getting processing stats: {e}")
-            raise
+        counters = await self._get_counters()
+        if counters is None:
+            counters = await self._seed_counters()
+        
+        periods = _counter_periods(datetime.utcnow())
+        total = int(counters.get("total", 0))
+        completed = int(counters.get("completed", 0))
+        failed = int(counters.get("failed", 0))
+        zones = int(counters.get("zones", 0))
+        timed_jobs = int(counters.get("timed_jobs", 0))
+        finished = completed + failed
+        
+        return ProcessingStatsResponse(
+            total_jobs=total,
+            active_jobs=await self.get_active_jobs_count(),
+            completed_jobs=completed,
+            failed_jobs=failed,
+            average_processing_time=(
+                float(counters.get("processing_seconds", 0)) / timed_jobs if timed_jobs else None
+            ),
+            total_zones_processed=zones,
+            average_zones_per_job=zones / total if total else None,
+            success_rate=completed / finished * 100 if finished else 0.0,
+            jobs_today=int(counters.get(periods["today"], 0)),
+            jobs_this_week=int(counters.get(periods["week"], 0)),
+            jobs_this_month=int(counters.get(periods["month"], 0))
+        )
+    
+    async def _seed_counters(self) -> Dict[str, Any]:
+        """Build the stats counters from processing_jobs (cold start only)"""
+        # Claim the seed before reading the table, so increments from status
+        # transitions that commit after the snapshot are parked, not lost
+        token = uuid.uuid4().hex
+        claimed = False
+        if self.redis_client:
+            try:
+                claimed = bool(await self.redis_client.eval(
+                    _BEGIN_COUNTERS_SEED, 1, STATS_COUNTERS_KEY, token, STATS_COUNTERS_SEED_TIMEOUT
+                ))
+            except Exception as e:
+                logger.warning(f"Failed to claim processing stats counters seed: {e}")
+        
+        now = datetime.utcnow()
+        day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        week_start = day_start - timedelta(days=day_start.weekday())
+        month_start = day_start.replace(day=1)
+        
+        async with self.db_pool_read.acquire() as conn:
+            row = await conn.fetchrow("""
+                SELECT 
+                    COUNT(*) as total,
+                    COUNT(*) FILTER (WHERE status IN ('queued', 'processing')) as active,
+                    COUNT(*) FILTER (WHERE status = 'completed') as completed,
+                    COUNT(*) FILTER (WHERE status = 'failed') as failed,
+                    COALESCE(SUM(total_zones), 0) as zones,
+                    COALESCE(SUM(EXTRACT(EPOCH FROM (completed_at - started_at))), 0) as processing_seconds,
+                    COUNT(completed_at - started_at) as timed_jobs,
+                    COUNT(*) FILTER (WHERE created_at >= $1) as today,
+                    COUNT(*) FILTER (WHERE created_at >= $2) as week,
+                    COUNT(*) FILTER (WHERE created_at >= $3) as month
+                FROM processing_jobs
+            """, day_start, week_start, month_start)
+        
+        periods = _counter_periods(now)
+        counters = {
+            "total": row["total"],
+            "active": row["active"],
+            "completed": row["completed"],
+            "failed": row["failed"],
+            "zones": row["zones"],
+            "processing_seconds": float(row["processing_seconds"]),
+            "timed_jobs": row["timed_jobs"],
+            periods["today"]: row["today"],
+            periods["week"]: row["week"],
+            periods["month"]: row["month"],
+        }
+        
+        if claimed:
+            args = [token, STATS_COUNTERS_TTL]
+            for field, value in counters.items():
+                args += (field, value)
+            try:
+                await self.redis_client.eval(_FINISH_COUNTERS_SEED, 1, STATS_COUNTERS_KEY, *args)
+            except Exception as e:
+                logger.warning(f"Failed to seed processing stats counters: {e}")
+        return counters
     
     async def get_job_history(self, job_id: uuid.UUID) -> List[ProcessingHistory]:
         """Get processing history for job"""
@@ -446,6 +883,32 @@ class ProcessingService:
         # Stub implementation
         return True
     
+    async def enqueue_processing(
+        self,
+        job_id: uuid.UUID,
+        document_id: uuid.UUID,
+        processing_request: ProcessingRequest,
+        background_tasks: BackgroundTasks
+    ):
+        """Queue a job on the arq worker pool, falling back to in-process background tasks"""
+        if self.arq_pool is not None:
+            try:
+                await self.arq_pool.enqueue_job(
+                    "process_document_task",
+                    str(job_id),
+                    str(document_id),
+                    processing_request.model_dump(mode="json"),
+                    _job_id=str(job_id)
+                )
+                return
+            except Exception as e:
+                logger.warning(f"Failed to enqueue job {job_id} on task queue, running in-process: {e}")
+        
+        background_tasks.add_task(
+            self.process_document_background,
+            job_id, document_id, processing_request
+        )
+    
     async def process_document_background(
         self, 
         job_id: uuid.UUID, 
@@ -453,12 +916,23 @@ class ProcessingService:
         processing_request: ProcessingRequest
     ):
         """High-performance background task for document processing"""
+        # Claim the job first so a duplicate delivery (retry, re-enqueue) is a no-op
+        if not await self._claim_job(job_id):
+            logger.info(f"Job {job_id} is no longer queued, skipping")
+            return
+        
+        await self._run_claimed_job(job_id, document_id, processing_request)
+
+    async def _run_claimed_job(
+        self,
+        job_id: uuid.UUID,
+        document_id: uuid.UUID,
+        processing_request: ProcessingRequest
+    ):
+        """Process a job this worker has already moved to processing"""
         logger.info(f"Starting high-performance processing for document {document_id} with job {job_id}")
         
         try:
-            # Update job status to processing
-            await self._update_job_status(job_id, ProcessingStatus.PROCESSING, 0.0)
-            
             # 1. Load document from storage
             document_path = await self._load_document_from_storage(document_id)
             logger.info(f"Document loaded: {document_path}")
@@ -469,7 +943,7 @@ class ProcessingService:
             
             # 3. Call high-performance unstructured processor
             progress_callback = lambda progress: asyncio.create_task(
-                self._update_job_progress(job_id, progress)
+                self._update_job_progress(job_id, progress, document_id)
             )
             
             result = await self._process_with_unstructured_parallel(
@@ -479,10 +953,16 @@ class ProcessingService:
             )
             
             # 4. Store results in database with parallel inserts
-            await self._store_processing_results_parallel(job_id, document_id, result)
+            zone_count = await self._store_processing_results_parallel(job_id, document_id, result)
             
-            # 5. Mark job as completed
-            await self._update_job_status(job_id, ProcessingStatus.COMPLETED, 100.0)
+            # 5. Mark job as completed, recording zone totals in the same UPDATE
+            await self._finalize_job(
+                job_id,
+                ProcessingStatus.COMPLETED,
+                document_id=document_id,
+                zone_count=zone_count,
+                metrics={k: v for k, v in result.items() if k != 'elements'}
+            )
             
             # 6. Cleanup temporary files
             if os.path.exists(document_path):
@@ -492,14 +972,16 @@ class ProcessingService:
         
         except Exception as e:
             logger.error(f"Error in high-performance processing for job {job_id}: {e}")
-            await self._update_job_status(job_id, ProcessingStatus.FAILED, 0.0, str(e))
+            await self._finalize_job(
+                job_id, ProcessingStatus.FAILED, document_id=document_id, error_message=str(e)
+            )
             raise
 
     async def _load_document_from_storage(self, document_id: uuid.UUID) -> str:
         """Load document from storage to temporary file"""
         try:
             # Get document metadata
-            async with self.db_pool.acquire() as conn:
+            async with self.db_pool_read.acquire() as conn:
                 row = await conn.fetchrow("""
                     SELECT filename, file_path, metadata 
                     FROM documents WHERE id = $1
@@ -628,14 +1110,14 @@ class ProcessingService:
             'quality_score': 0.85
         }
 
-    async def _store_processing_results_parallel(self, job_id: uuid.UUID, document_id: uuid.UUID, result: dict):
-        """Store processing results with parallel database inserts"""
+    async def _store_processing_results_parallel(self, job_id: uuid.UUID, document_id: uuid.UUID, result: dict) -> int:
+        """Store processing results with parallel database inserts, returning the element count"""
         try:
             elements = result.get('elements', [])
             
             if not elements:
                 logger.warning(f"No elements to store for job {job_id}")
-                return
+                return 0
             
             # Use parallel inserts for better performance
             tasks = []
@@ -649,25 +1131,8 @@ class ProcessingService:
             # Execute all batches in parallel
             await asyncio.gather(*tasks)
             
-            # Update job metadata
-            async with self.db_pool.acquire() as conn:
-                await conn.execute("""
-                    UPDATE processing_jobs 
-                    SET 
-                        total_zones = $1,
-                        completed_zones = $2,
-                        metadata = $3,
-                        updated_at = $4
-                    WHERE id = $5
-                """, 
-                    len(elements), 
-                    len(elements),
-                    result,  # Store full result as metadata
-                    datetime.utcnow(), 
-                    job_id
-                )
-            
             logger.info(f"Stored {len(elements)} elements for job {job_id}")
+            return len(elements)
             
         except Exception as e:
             logger.error(f"Error storing results for job {job_id}: {e}")
@@ -700,43 +1165,184 @@ class ProcessingService:
             logger.error(f"Error inserting batch at offset {offset}: {e}")
             raise
 
-    async def _update_job_status(self, job_id: uuid.UUID, status: ProcessingStatus, progress: float, error_message: str = None):
-        """Update job status and progress"""
+    async def _claim_job(self, job_id: uuid.UUID) -> bool:
+        """Move a queued job to processing; False if it was already claimed or cancelled"""
+        async with self.db_pool.acquire() as conn:
+            claimed = await conn.fetchval("""
+                UPDATE processing_jobs 
+                SET status = 'processing', started_at = NOW(), progress = 0, updated_at = NOW()
+                WHERE id = $1 AND status = 'queued'
+                RETURNING id
+            """, job_id)
+        return claimed is not None
+
+    async def claim_next_job(
+        self,
+        n: int = 1,
+        queued_before: Optional[datetime] = None
+    ) -> List[ProcessingResponse]:
+        """Claim up to n queued jobs, oldest first, for a polling worker.
+        
+        FOR UPDATE SKIP LOCKED lets concurrent workers claim disjoint batches
+        without blocking on each other's rows.
+        """
+        async with self.db_pool.acquire() as conn:
+            rows = await conn.fetch("""
+                UPDATE processing_jobs 
+                SET status = 'processing', started_at = NOW(), progress = 0, updated_at = NOW()
+                WHERE id IN (
+                    SELECT id FROM processing_jobs 
+                    WHERE status = 'queued' AND created_at < COALESCE($2, 'infinity'::timestamptz)
+                    ORDER BY created_at
+                    FOR UPDATE SKIP LOCKED
+                    LIMIT $1
+                )
+                RETURNING *
+            """, n, queued_before)
+        return [ProcessingResponse.from_record(row) for row in rows]
+
+    async def run_claimed_job(self, job: ProcessingResponse):
+        """Process a job returned by claim_next_job"""
+        await self._run_claimed_job(
+            job.id,
+            job.document_id,
+            ProcessingRequest(strategy=job.strategy, options=job.options)
+        )
+
+    async def _finalize_job(
+        self,
+        job_id: uuid.UUID,
+        status: ProcessingStatus,
+        document_id: Optional[uuid.UUID] = None,
+        error_message: str = None,
+        zone_count: Optional[int] = None,
+        metrics: Optional[Dict[str, Any]] = None
+    ):
+        """Write the terminal job state (and result totals) in a single UPDATE
+        
+        Only a job still processing is finalized, so a late finish never
+        overwrites a job that was cancelled (or failed) in the meantime.
+        """
+        self._progress.discard(job_id)
+        now = datetime.utcnow()
+        progress = 100.0 if status == ProcessingStatus.COMPLETED else 0.0
         try:
             async with self.db_pool.acquire() as conn:
-                if status == ProcessingStatus.PROCESSING:
-                    await conn.execute("""
-                        UPDATE processing_jobs 
-                        SET status = $1, started_at = $2, progress = $3, updated_at = $4
-                        WHERE id = $5
-                    """, status, datetime.utcnow(), progress, datetime.utcnow(), job_id)
-                elif status == ProcessingStatus.COMPLETED:
-                    await conn.execute("""
-                        UPDATE processing_jobs 
-                        SET status = $1, completed_at = $2, progress = $3, updated_at = $4
-                        WHERE id = $5
-                    """, status, datetime.utcnow(), progress, datetime.utcnow(), job_id)
-                elif status == ProcessingStatus.FAILED:
-                    await conn.execute("""
-                        UPDATE processing_jobs 
-                        SET status = $1, error_message = $2, progress = $3, updated_at = $4
-                        WHERE id = $5
-                    """, status, error_message, progress, datetime.utcnow(), job_id)
+                row = await conn.fetchrow("""
+                    UPDATE processing_jobs
+                    SET status = $1,
+                        started_at = COALESCE(started_at, $2),
+                        completed_at = $2,
+                        progress = $3,
+                        error_message = $4,
+                        total_zones = COALESCE($5, total_zones),
+                        completed_zones = COALESCE($5, completed_zones),
+                        metrics = COALESCE($6, metrics),
+                        updated_at = $2
+                    WHERE id = $7 AND status = 'processing'
+                    RETURNING EXTRACT(EPOCH FROM (completed_at - started_at)) AS duration
+                """, status, now, progress, error_message, zone_count, metrics, job_id)
+            
+            await self._invalidate_stats_cache()
         except Exception as e:
-            logger.error(f"Error updating job status for {job_id}: {e}")
+            logger.error(f"Error finalizing job {job_id}: {e}")
+        else:
+            if row is None:
+                logger.info(f"Job {job_id} is no longer processing, not marking it {status.value}")
+                return
+            increments = {status.value: 1, "active": -1}
+            if zone_count:
+                increments["zones"] = zone_count
+            if row["duration"] is not None:
+                increments["processing_seconds"] = float(row["duration"])
+                increments["timed_jobs"] = 1
+            await self._incr_counters(increments)
+        
+        await self._publish_progress(job_id, document_id, progress, status, error_message)
+
+    async def _update_job_progress(
+        self,
+        job_id: uuid.UUID,
+        progress: float,
+        document_id: Optional[uuid.UUID] = None
+    ):
+        """Update job progress for real-time feedback (persisted in coalesced batches)"""
+        self._progress.submit(job_id, progress)
+        await self._publish_progress(job_id, document_id, progress, ProcessingStatus.PROCESSING)
+        logger.debug(f"Job {job_id} progress: {progress}%")
 
-    async def _update_job_progress(self, job_id: uuid.UUID, progress: float):
-        """Update job progress for real-time feedback"""
+    async def _publish_progress(
+        self,
+        job_id: uuid.UUID,
+        document_id: Optional[uuid.UUID],
+        progress: float,
+        status: ProcessingStatus,
+        error_message: Optional[str] = None
+    ):
+        """Fan a progress event out to subscribers so clients need not poll the database"""
+        payload = json.dumps({
+            "job_id": str(job_id),
+            "document_id": str(document_id) if document_id else None,
+            "progress": progress,
+            "status": status,
+            "error_message": error_message
+        })
         try:
-            async with self.db_pool.acquire() as conn:
-                await conn.execute("""
-                    UPDATE processing_jobs 
-                    SET progress = $1, updated_at = $2
-                    WHERE id = $3
-                """, progress, datetime.utcnow(), job_id)
-            
-            # TODO: Send WebSocket progress update here
-            logger.debug(f"Job {job_id} progress: {progress}%")
-            
+            if self.redis_client:
+                await self.redis_client.publish(progress_channel(job_id), payload)
+            elif self.db_pool:
+                async with self.db_pool.acquire() as conn:
+                    await conn.execute("SELECT pg_notify($1, $2)", PROGRESS_NOTIFY_CHANNEL, payload)
+        except Exception as e:
+            logger.warning(f"Failed to publish progress for job {job_id}: {e}")
+
+    async def _cache_get(self, key: str) -> Optional[str]:
+        """Get value from cache"""
+        if not self.redis_client:
+            return None
+        try:
+            return await self.redis_client.get(key)
+        except Exception as e:
+            logger.warning(f"Cache get failed for key {key}: {e}")
+            return None
+
+    async def _cache_set(self, key: str, value: str, ttl: int = STATS_CACHE_TTL):
+        """Set value in cache with a short TTL"""
+        if not self.redis_client:
+            return
+        try:
+            await self.redis_client.set(key, value, ex=ttl)
+        except Exception as e:
+            logger.warning(f"Cache set failed for key {key}: {e}")
+
+    async def _get_counters(self) -> Optional[Dict[str, str]]:
+        """Read the stats counters hash, or None if it has not been seeded"""
+        if not self.redis_client:
+            return None
+        try:
+            counters = await self.redis_client.hgetall(STATS_COUNTERS_KEY)
+        except Exception as e:
+            logger.warning(f"Failed to read processing stats counters: {e}")
+            return None
+        return counters if "seeded" in counters else None
+
+    async def _incr_counters(self, increments: Dict[str, float]):
+        """Apply counter increments to the seeded stats hash in one round trip"""
+        if not self.redis_client or not increments:
+            return
+        args = []
+        for field, amount in increments.items():
+            args += (field, repr(amount), "f" if isinstance(amount, float) else "i")
+        try:
+            await self.redis_client.eval(_INCR_SEEDED_COUNTERS, 1, STATS_COUNTERS_KEY, *args)
+        except Exception as e:
+            logger.warning(f"Failed to update processing stats counters: {e}")
+
+    async def _invalidate_stats_cache(self):
+        """Drop cached aggregates after a job status transition"""
+        if not self.redis_client:
+            return
+        try:
+            await self.redis_client.delete(ACTIVE_JOBS_CACHE_KEY)
         except Exception as e:
-            logger.error(f"Error updating progress for job {job_id}: {e}") 
\ No newline at end of file
+            logger.warning(f"Failed to invalidate processing stats cache: {e}")
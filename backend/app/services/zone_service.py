@@ -2,14 +2,46 @@
 Zone management service for handling zone CRUD operations
 """
 
+import asyncio
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+from contextlib import asynccontextmanager
+from collections import Counter, defaultdict
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator, List, Optional, Dict, Any, Set, Tuple
 from uuid import UUID, uuid4
 from datetime import datetime
 import json
+import re
+from operator import attrgetter, itemgetter
 import asyncpg
 from supabase import Client
 import redis.asyncio as redis
+from redis.asyncio.cluster import RedisCluster
+from redis.crc import key_slot
+
+try:
+    import orjson
+    
+    def _json_dumps(value: Any) -> str:
+        return orjson.dumps(value).decode()
+    
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+try:
+    from cachetools import TTLCache
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    TTLCache = None
+    CACHETOOLS_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 from app.models.zone import (
     Zone, ZoneCreate, ZoneUpdate, ZoneResponse,
@@ -18,6 +50,9 @@ from app.models.zone import (
     ZoneBatchUpdateRequest, ZoneBatchUpdateResponse
 )
 from app.models.processing import ZoneType, ZoneStatus, ZoneCoordinates
+from app.middleware.request_cache import get_request_cache
+from app.websocket.conflict_resolver import ConflictResolutionStrategy
+from app.websocket.events import ZoneCollaborationEvent, ZoneProcessingEvent, EventType
 from app.middleware.errors import (
     ZoneNotFoundError, InvalidZoneOperationError,
     ZoneProcessingError
@@ -25,6 +60,293 @@ from app.middleware.errors import (
 
 logger = logging.getLogger(__name__)
 
+# Cache-aside TTLs for zone reads (seconds)
+ZONE_CACHE_TTL = 300
+ZONE_LIST_CACHE_TTL = 60
+
+# How long an invalidated zone list may still be served while it is rebuilt,
+# and how long one reader may hold the rebuild before another takes over
+ZONE_LIST_STALE_TTL = 30
+ZONE_LIST_REFRESH_LOCK_TTL = 10
+
+# Readers without a stale copy poll this often, for at most this long, for
+# another reader's rebuild before falling back to the database (seconds)
+ZONE_LIST_REFRESH_POLL = 0.05
+ZONE_LIST_REFRESH_WAIT = 2.0
+
+# In-process zone lists in front of Redis, by document: repeated viewer reloads
+# within the TTL never leave the worker. Other workers may serve a list this
+# much older than their own invalidations (seconds)
+ZONE_LIST_L1_TTL = 5
+ZONE_LIST_L1_MAXSIZE = 1024
+
+# Bumped whenever the cached Zone JSON changes shape, so a deploy starts from
+# fresh keys instead of failing to parse the previous version's entries
+ZONE_CACHE_VERSION = "v1"
+
+def _zone_key(zone_id: UUID) -> str:
+    """Cache-aside key of a single zone"""
+    return f"{ZONE_CACHE_VERSION}:zone:{zone_id}"
+
+def _zone_list_key(document_id: UUID) -> str:
+    """Hash of a document's cached zone lists, one field per filter combination"""
+    # The braces make the document id the Redis Cluster hash tag, so the list,
+    # its :stale copy and its :refresh locks share a slot and RENAME between
+    # them stays valid on a cluster
+    return f"document:{{{document_id}}}:zones"
+
+def _zone_list_field(
+    zone_type: Optional[ZoneType],
+    status: Optional[ZoneStatus],
+    page_number: Optional[int]
+) -> str:
+    """Field of a filter combination within a document:{id}:zones hash"""
+    return f"{zone_type}|{status}|{page_number}"
+
+_UNFILTERED_ZONE_LIST_FIELD = _zone_list_field(None, None, None)
+
+# Optimistic-locking versions live in Redis so every worker sees the same
+# counter; idle zones' counters expire and restart from zero
+ZONE_VERSION_TTL = 86400
+
+def _zone_version_key(zone_id: UUID) -> str:
+    """Collaborative edit version counter of a zone"""
+    return f"zone:{zone_id}:version"
+
+# Compare the client's version with the current one and, if it is not stale,
+# bump it, all in one atomic round trip. Returns {bumped, version}
+_ZONE_VERSION_CHECK_AND_BUMP = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+if tonumber(ARGV[1]) < current then
+    return {0, current}
+end
+local bumped = redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return {1, bumped}
+"""
+
+# document:{id}:zones key -> {filter field: ZoneListResponse}, plus one lock per
+# (key, field) so concurrent misses in this process load the list once
+_zone_list_l1: Optional[Dict[str, Dict[str, ZoneListResponse]]] = (
+    TTLCache(maxsize=ZONE_LIST_L1_MAXSIZE, ttl=ZONE_LIST_L1_TTL) if CACHETOOLS_AVAILABLE else None
+)
+_zone_list_l1_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+# Zone list prefetches running in this process, by document; holding the task
+# keeps it alive and stops a document being prefetched twice at once
+_prefetch_tasks: Dict[UUID, "asyncio.Task[None]"] = {}
+
+# Most keys a single cache invalidation UNLINK carries
+CACHE_INVALIDATION_BATCH = 128
+
+# Invalidations arriving within this window of each other go out together
+ZONE_INVALIDATION_WINDOW = 0.1
+
+def _unlink_batches(keys: List[str], by_slot: bool) -> Iterator[List[str]]:
+    """Split keys into UNLINK argument lists of at most CACHE_INVALIDATION_BATCH
+    
+    Zone keys are looked up by zone id alone, so they carry no hash tag and
+    scatter across a cluster's slots; with by_slot each list holds keys of a
+    single slot, as Redis Cluster rejects multi-key commands spanning slots.
+    """
+    groups: Iterable[List[str]] = [keys]
+    if by_slot:
+        slots: Dict[int, List[str]] = defaultdict(list)
+        for key in keys:
+            slots[key_slot(key.encode())].append(key)
+        groups = slots.values()
+    for group in groups:
+        for start in range(0, len(group), CACHE_INVALIDATION_BATCH):
+            yield group[start:start + CACHE_INVALIDATION_BATCH]
+
+class _ZoneCacheInvalidator:
+    """Coalesces zone cache invalidations for one Redis client in the background"""
+    
+    def __init__(self, redis_client):
+        self.redis = redis_client
+        self.zone_keys: Set[str] = set()
+        self.list_keys: Set[str] = set()
+        self.task: Optional["asyncio.Task[None]"] = None
+    
+    def submit(self, zone_keys: Iterable[str], list_keys: Iterable[str]):
+        self.zone_keys.update(zone_keys)
+        self.list_keys.update(list_keys)
+        if self.task is None:
+            self.task = asyncio.create_task(self._flush())
+    
+    async def _flush(self):
+        try:
+            # Anything submitted while a batch is on the wire joins the next one
+            while self.zone_keys or self.list_keys:
+                await asyncio.sleep(ZONE_INVALIDATION_WINDOW)
+                zone_keys, self.zone_keys = list(self.zone_keys), set()
+                list_keys, self.list_keys = list(self.list_keys), set()
+                await self.unlink(zone_keys, list_keys)
+        finally:
+            self.task = None
+    
+    async def unlink(self, zone_keys: List[str], list_keys: List[str]):
+        """Drop zone keys and set aside zone lists in one pipelined round trip
+        
+        A failed round trip is retried once; keys still left after that are
+        only cleared by their TTLs, so the failure is logged as an error.
+        """
+        for attempt in range(2):
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                # Variadic UNLINKs (Redis frees the values off its main thread),
+                # capped in size so a huge batch never becomes one long command
+                for batch in _unlink_batches(zone_keys, isinstance(self.redis, RedisCluster)):
+                    pipe.unlink(*batch)
+                # Zone lists are set aside rather than dropped, so concurrent
+                # readers can be served the previous copy while one rebuilds it
+                for key in list_keys:
+                    pipe.rename(key, f"{key}:stale")
+                    pipe.expire(f"{key}:stale", ZONE_LIST_STALE_TTL)
+                # RENAME fails for lists that were never cached, which is fine
+                await pipe.execute(raise_on_error=False)
+                # A read while the pipeline was on the wire can have copied the
+                # old Redis list back into this process's cache
+                if _zone_list_l1 is not None:
+                    for key in list_keys:
+                        _zone_list_l1.pop(key, None)
+                return
+            except Exception as e:
+                if attempt:
+                    logger.error(
+                        "Failed to clear zone cache, %d zone and %d list keys left stale: %s",
+                        len(zone_keys), len(list_keys), e
+                    )
+                else:
+                    logger.warning("Failed to clear zone cache, retrying: %s", e)
+
+# One invalidator per Redis client (in practice the application's single client)
+_invalidators: Dict[Any, _ZoneCacheInvalidator] = {}
+
+async def drain_zone_cache_invalidations():
+    """Wait for background zone cache invalidations, before Redis is closed"""
+    tasks = [inv.task for inv in _invalidators.values() if inv.task is not None]
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+# Rows fetched per round trip when streaming a document's zones
+ZONE_CURSOR_PREFETCH = 256
+
+# Zone updates in flight at once for a demo-mode batch update
+DEMO_BATCH_CONCURRENCY = 10
+
+# Above this many characters, word counts scan the content instead of splitting
+# it, keeping memory flat for very large zones
+_WORD_COUNT_SCAN_THRESHOLD = 64 * 1024
+_WORD_RE = re.compile(r'\S+')
+
+# Smart merges join a group's contents with its type's separator: text keeps
+# paragraph breaks, tables and every other type keep line structure
+_MERGE_SEPARATORS = {"text": "\n\n", "table": "\n"}
+
+# Merges of at least this many zones order preserve_layout content with numpy
+_NUMPY_SORT_THRESHOLD = 2048
+
+# Read list for zones: the coordinate scalars replace the coordinates JSONB
+_ZONE_SELECT_COLUMNS = (
+    "id, document_id, zone_index, page_number, zone_type, content, confidence, "
+    "processing_tool, status, error_message, processing_duration, created_at, "
+    "updated_at, metadata, x, y, width, height, page_width, page_height"
+)
+_COORDINATE_COLUMNS = ("x", "y", "width", "height", "page_width", "page_height")
+
+def _zone_from_row(row) -> Zone:
+    """Build a Zone from a row read with _ZONE_SELECT_COLUMNS.
+    
+    Rows come straight from the zones table, so only the enum and JSONB
+    columns are converted and field validation is skipped.
+    """
+    zone_dict = dict(row)
+    for column in _COORDINATE_COLUMNS:
+        del zone_dict[column]
+    zone_dict['coordinates'] = ZoneCoordinates.from_record(row)
+    zone_dict['zone_type'] = ZoneType(zone_dict['zone_type'])
+    zone_dict['status'] = ZoneStatus(zone_dict['status'])
+    confidence = zone_dict['confidence']
+    if confidence is not None:
+        zone_dict['confidence'] = float(confidence)
+    metadata = zone_dict['metadata']
+    zone_dict['metadata'] = (_json_loads(metadata) if isinstance(metadata, str) else metadata) or {}
+    return Zone.model_construct(**zone_dict)
+
+# Every filter combination shares one statement text, so each connection
+# prepares the listing and statistics queries once instead of once per
+# combination; unused filters are bound as NULL
+_ZONE_FILTER_SQL = (
+    "document_id = $1"
+    " AND ($2::zone_type IS NULL OR zone_type = $2)"
+    " AND ($3::zone_status IS NULL OR status = $3)"
+    " AND ($4::integer IS NULL OR page_number = $4)"
+)
+
+# Hot per-id statements, kept as module constants so every call sends the
+# same text and reuses the statement asyncpg prepared on that connection
+_SELECT_ZONE_SQL = f"SELECT {_ZONE_SELECT_COLUMNS} FROM zones WHERE id = $1"
+_SELECT_ZONES_SQL = f"SELECT {_ZONE_SELECT_COLUMNS} FROM zones WHERE id = ANY($1::uuid[])"
+_DELETE_ZONE_SQL = "DELETE FROM zones WHERE id = $1 RETURNING document_id"
+
+# Columns a ZoneUpdate can set, in bind order; bit i of a mask marks column i as present
+_ZONE_UPDATE_COLUMNS = (
+    "zone_type", "coordinates", "content", "confidence",
+    "processing_tool", "status", "metadata"
+)
+_ZONE_JSONB_COLUMNS = frozenset({"coordinates", "metadata"})
+
+def _build_update_zone_sql(mask: int, where: str, returning: str) -> str:
+    set_clauses = ["updated_at = $2"]
+    columns = [c for i, c in enumerate(_ZONE_UPDATE_COLUMNS) if mask >> i & 1]
+    for param, column in enumerate(columns, start=3):
+        cast = "::jsonb" if column in _ZONE_JSONB_COLUMNS else ""
+        set_clauses.append(f"{column} = ${param}{cast}")
+    return f"UPDATE zones SET {', '.join(set_clauses)} WHERE {where} RETURNING {returning}"
+
+def _zone_update_params(zone_update: ZoneUpdate) -> Tuple[int, List[Any]]:
+    """Column mask and bind values (from $3 on) for a ZoneUpdate"""
+    mask = 0
+    values = []
+    for bit, column in enumerate(_ZONE_UPDATE_COLUMNS):
+        value = getattr(zone_update, column)
+        if value is None:
+            continue
+        mask |= 1 << bit
+        if column == 'coordinates':
+            values.append(value.model_dump_json())
+        elif column == 'metadata':
+            values.append(_json_dumps(value))
+        elif column == 'zone_type':
+            # Validated models hold plain strings (use_enum_values), constructed
+            # ones may hold members; the enum call accepts either
+            values.append(ZoneType(value).value)
+        elif column == 'status':
+            values.append(ZoneStatus(value).value)
+        else:
+            values.append(value)
+    return mask, values
+
+# Every field combination is generated once at import, so updates do no SQL
+# building and each combination always maps to the same prepared statement
+_UPDATE_ZONE_SQL = {
+    mask: _build_update_zone_sql(mask, "id = $1", _ZONE_SELECT_COLUMNS)
+    for mask in range(1 << len(_ZONE_UPDATE_COLUMNS))
+}
+_REPROCESS_ZONE_SQL = f"""
+    UPDATE zones
+    SET updated_at = $2, status = $3::zone_status, processing_tool = $4,
+        confidence = $5, content = $6,
+        metadata = COALESCE(metadata, '{{}}'::jsonb) || $7::jsonb
+    WHERE id = $1
+    RETURNING {_ZONE_SELECT_COLUMNS}
+"""
+_BATCH_UPDATE_ZONE_SQL = {
+    mask: _build_update_zone_sql(mask, "id = ANY($1::uuid[])", "id, document_id")
+    for mask in range(1 << len(_ZONE_UPDATE_COLUMNS))
+}
+
 class ZoneService:
     """Service for managing document zones"""
     
@@ -40,9 +362,10 @@ class ZoneService:
         self.supabase = supabase_client
         self.redis = redis_client
         self._demo_zones = {}  # For demo mode
+        self._zones_by_document: Dict[UUID, set] = defaultdict(set)  # Demo zone ids per document
         self.connection_manager = connection_manager
         self.conflict_resolver = conflict_resolver
-        self._zone_versions = {}  # Track zone versions for optimistic locking
+        self._zone_versions = {}  # Optimistic-locking versions when Redis is unavailable
         
     async def get_zones_by_document(
         self,
@@ -53,47 +376,212 @@ class ZoneService:
     ) -> ZoneListResponse:
         """Get all zones for a document with optional filters"""
         try:
-            zones = []
+            if self.db_pool and self.redis:
+                return await self._cached_zone_list(
+                    document_id,
+                    _zone_list_field(zone_type, status, page_number),
+                    lambda: self._load_zone_list(document_id, zone_type, status, page_number)
+                )
+            return await self._load_zone_list(document_id, zone_type, status, page_number)
             
-            if self.db_pool:
-                # Production mode with database
-                query = """
-                    SELECT * FROM zones 
-                    WHERE document_id = $1
-                """
-                params = [document_id]
-                conditions = []
-                
-                if zone_type:
-                    conditions.append(f"zone_type = ${len(params) + 1}")
-                    params.append(zone_type.value if hasattr(zone_type, 'value') else zone_type)
-                
-                if status:
-                    conditions.append(f"status = ${len(params) + 1}")
-                    params.append(status.value if hasattr(status, 'value') else status)
-                
-                if page_number:
-                    conditions.append(f"page_number = ${len(params) + 1}")
-                    params.append(page_number)
-                
-                if conditions:
-                    query += " AND " + " AND ".join(conditions)
-                
-                query += " ORDER BY page_number, zone_index"
+        except Exception as e:
+            logger.error(f"Error fetching zones for document {document_id}: {str(e)}")
+            raise
+    
+    async def _cached_zone_list(
+        self,
+        document_id: UUID,
+        field: str,
+        load: Callable[[], Awaitable[ZoneListResponse]]
+    ) -> ZoneListResponse:
+        """Read a zone list through the document's list cache, stale-while-revalidate"""
+        # Every filter combination lives in one hash per document, so the
+        # existing document:{id}:zones invalidation covers them all at once
+        list_cache_key = _zone_list_key(document_id)
+        memo = get_request_cache()
+        if memo is not None:
+            # Repeat reads within one request skip Redis entirely
+            memo_lists = memo.setdefault(list_cache_key, {})
+            if field in memo_lists:
+                return memo_lists[field]
+            response = await self._local_zone_list(list_cache_key, field, load)
+            memo_lists[field] = response
+            return response
+        return await self._local_zone_list(list_cache_key, field, load)
+    
+    async def _local_zone_list(
+        self,
+        list_cache_key: str,
+        field: str,
+        load: Callable[[], Awaitable[ZoneListResponse]]
+    ) -> ZoneListResponse:
+        """Read a zone list from the in-process cache, falling through to Redis"""
+        if _zone_list_l1 is None:
+            return await self._read_zone_list(list_cache_key, field, load)
+        
+        lists = _zone_list_l1.get(list_cache_key)
+        if lists is not None and field in lists:
+            return lists[field]
+        
+        lock_key = (list_cache_key, field)
+        lock = _zone_list_l1_locks.get(lock_key)
+        if lock is None:
+            lock = _zone_list_l1_locks[lock_key] = asyncio.Lock()
+        try:
+            async with lock:
+                # A reader ahead of this one may have filled it already
+                lists = _zone_list_l1.get(list_cache_key)
+                if lists is None:
+                    lists = _zone_list_l1[list_cache_key] = {}
+                elif field in lists:
+                    return lists[field]
+                response = await self._read_zone_list(list_cache_key, field, load)
+                # An invalidation during the read dropped this dict from the
+                # cache, so the possibly stale response is not served again
+                lists[field] = response
+                return response
+        finally:
+            if _zone_list_l1_locks.get(lock_key) is lock:
+                del _zone_list_l1_locks[lock_key]
+    
+    async def _read_zone_list(
+        self,
+        list_cache_key: str,
+        field: str,
+        load: Callable[[], Awaitable[ZoneListResponse]]
+    ) -> ZoneListResponse:
+        """Read one cached zone list from Redis, rebuilding it on a miss"""
+        refresh_lock = None
+        try:
+            cached = await self.redis.hget(list_cache_key, field)
+            if cached:
+                return ZoneListResponse.model_validate_json(cached)
+            
+            # Only the reader holding the refresh lock rebuilds the list;
+            # concurrent readers get the copy invalidation set aside or, with
+            # none, wait for the rebuild before querying the database themselves
+            refresh_lock = f"{list_cache_key}:refresh:{field}"
+            if not await self.redis.set(refresh_lock, "1", nx=True, ex=ZONE_LIST_REFRESH_LOCK_TTL):
+                refresh_lock = None
+                stale = await self.redis.hget(f"{list_cache_key}:stale", field)
+                if stale:
+                    return ZoneListResponse.model_validate_json(stale)
                 
-                async with self.db_pool.acquire() as conn:
-                    rows = await conn.fetch(query, *params)
-                    zones = [Zone(**dict(row)) for row in rows]
-            else:
-                # Demo mode
-                zones = [
-                    zone for zone in self._demo_zones.values()
-                    if zone.document_id == document_id
-                    and (not zone_type or zone.zone_type == zone_type)
-                    and (not status or zone.status == status)
-                    and (not page_number or zone.page_number == page_number)
-                ]
-                zones.sort(key=lambda z: (z.page_number, z.zone_index))
+                deadline = asyncio.get_running_loop().time() + ZONE_LIST_REFRESH_WAIT
+                while asyncio.get_running_loop().time() < deadline:
+                    await asyncio.sleep(ZONE_LIST_REFRESH_POLL)
+                    cached = await self.redis.hget(list_cache_key, field)
+                    if cached:
+                        return ZoneListResponse.model_validate_json(cached)
+        except Exception as e:
+            logger.warning("Zone list cache read failed for %s: %s", list_cache_key, e)
+        
+        response = await load()
+        
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.hset(list_cache_key, field, response.model_dump_json())
+            pipe.expire(list_cache_key, ZONE_LIST_CACHE_TTL)
+            if refresh_lock:
+                pipe.unlink(refresh_lock)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning("Zone list cache write failed for %s: %s", list_cache_key, e)
+        
+        return response
+    
+    def _prefetch_zone_list(self, document_id: UUID):
+        """Pull the document's cached unfiltered zone list into this process in the background"""
+        if _zone_list_l1 is None or document_id in _prefetch_tasks:
+            return
+        lists = _zone_list_l1.get(_zone_list_key(document_id))
+        if lists is not None and _UNFILTERED_ZONE_LIST_FIELD in lists:
+            return
+        task = asyncio.create_task(self._warm_zone_list(document_id))
+        _prefetch_tasks[document_id] = task
+        task.add_done_callback(lambda _: _prefetch_tasks.pop(document_id, None))
+    
+    async def _warm_zone_list(self, document_id: UUID):
+        """Copy a zone list from Redis to the in-process cache.
+        
+        Only one Redis round trip: a list Redis does not hold is left for the
+        next list read to build, so opening a zone never queries the whole
+        document.
+        """
+        list_cache_key = _zone_list_key(document_id)
+        field = _UNFILTERED_ZONE_LIST_FIELD
+        # Taken before the read, so an invalidation meanwhile orphans this dict
+        lists = _zone_list_l1.get(list_cache_key)
+        if lists is None:
+            lists = _zone_list_l1[list_cache_key] = {}
+        try:
+            cached = await self.redis.hget(list_cache_key, field)
+            if cached:
+                lists.setdefault(field, ZoneListResponse.model_validate_json(cached))
+        except Exception as e:
+            logger.warning("Zone list prefetch failed for document %s: %s", document_id, e)
+    
+    async def _load_zone_list(
+        self,
+        document_id: UUID,
+        zone_type: Optional[ZoneType],
+        status: Optional[ZoneStatus],
+        page_number: Optional[int]
+    ) -> ZoneListResponse:
+        """Build a document's zone list and statistics from the database or demo store"""
+        if self.db_pool:
+            # Production mode with database
+            where_clause, params = self._zone_filter(document_id, zone_type, status, page_number)
+            
+            # Rows and statistics are read on one connection from one snapshot,
+            # so the counts always describe the zones returned with them
+            async with self.db_pool.acquire() as conn:
+                async with conn.transaction(isolation='repeatable_read', readonly=True):
+                    # Per-type and per-status counts plus the overall average in one scan
+                    stats_rows = await conn.fetch(f"""
+                        SELECT zone_type, status,
+                               GROUPING(zone_type) AS all_types,
+                               GROUPING(status) AS all_statuses,
+                               COUNT(*) AS count,
+                               AVG(confidence) AS average_confidence
+                        FROM zones WHERE {where_clause}
+                        GROUP BY GROUPING SETS ((zone_type), (status), ())
+                    """, *params)
+                    
+                    # Rows are converted as each cursor batch arrives rather
+                    # than after the whole result set has been buffered
+                    zone_responses = [
+                        self._to_response(_zone_from_row(row))
+                        async for row in conn.cursor(
+                            f"SELECT {_ZONE_SELECT_COLUMNS} FROM zones WHERE {where_clause} "
+                            f"ORDER BY page_number, zone_index",
+                            *params,
+                            prefetch=ZONE_CURSOR_PREFETCH
+                        )
+                    ]
+            
+            by_type = {}
+            by_status = {}
+            average_confidence = None
+            for stats in stats_rows:
+                if not stats['all_types']:
+                    by_type[stats['zone_type']] = stats['count']
+                elif not stats['all_statuses']:
+                    by_status[stats['status']] = stats['count']
+                elif stats['average_confidence'] is not None:
+                    average_confidence = float(stats['average_confidence'])
+        else:
+            # Demo mode
+            zones = [
+                zone for zone in map(
+                    self._demo_zones.__getitem__,
+                    self._zones_by_document.get(document_id, ())
+                )
+                if (not zone_type or zone.zone_type == zone_type)
+                and (not status or zone.status == status)
+                and (not page_number or zone.page_number == page_number)
+            ]
+            zones.sort(key=lambda z: (z.page_number, z.zone_index))
             
             # Calculate statistics
             by_type = {}
@@ -113,22 +601,69 @@ class ZoneService:
             average_confidence = total_confidence / confidence_count if confidence_count > 0 else None
             
             # Convert to response models
-            zone_responses = []
-            for zone in zones:
-                zone_response = ZoneResponse(**zone.model_dump())
-                zone_responses.append(zone_response)
-            
-            return ZoneListResponse(
-                zones=zone_responses,
-                total=len(zones),
-                by_type=by_type,
-                by_status=by_status,
-                average_confidence=average_confidence
-            )
-            
-        except Exception as e:
-            logger.error(f"Error fetching zones for document {document_id}: {str(e)}")
-            raise
+            zone_responses = [self._to_response(zone) for zone in zones]
+        
+        return ZoneListResponse(
+            zones=zone_responses,
+            total=len(zone_responses),
+            by_type=by_type,
+            by_status=by_status,
+            average_confidence=average_confidence
+        )
+    
+    async def iter_zones_by_document(
+        self,
+        document_id: UUID,
+        zone_type: Optional[ZoneType] = None,
+        status: Optional[ZoneStatus] = None,
+        page_number: Optional[int] = None
+    ) -> AsyncIterator[ZoneResponse]:
+        """Yield a document's zones one at a time without materializing the full list"""
+        if self.db_pool:
+            where_clause, params = self._zone_filter(document_id, zone_type, status, page_number)
+            async for zone in self._stream_zones(where_clause, params):
+                yield zone
+            return
+        
+        for zone in (await self.get_zones_by_document(document_id, zone_type, status, page_number)).zones:
+            yield zone
+    
+    @staticmethod
+    def _zone_filter(
+        document_id: UUID,
+        zone_type: Optional[ZoneType],
+        status: Optional[ZoneStatus],
+        page_number: Optional[int]
+    ) -> Tuple[str, List[Any]]:
+        """WHERE clause and parameters for a document's zone listing"""
+        return _ZONE_FILTER_SQL, [
+            document_id,
+            zone_type.value if hasattr(zone_type, 'value') else zone_type,
+            status.value if hasattr(status, 'value') else status,
+            page_number or None
+        ]
+    
+    async def _stream_zones(self, where_clause: str, params: List[Any]) -> AsyncIterator[ZoneResponse]:
+        """Fetch zones in keyset pages of ZONE_CURSOR_PREFETCH rows
+        
+        The connection goes back to the pool between pages, so a slow consumer
+        holds neither a connection nor an open transaction while it reads.
+        """
+        n = len(params)
+        query = (
+            f"SELECT {_ZONE_SELECT_COLUMNS} FROM zones WHERE {where_clause} "
+            f"AND (page_number, zone_index) > (${n + 1}, ${n + 2}) "
+            f"ORDER BY page_number, zone_index LIMIT ${n + 3}"
+        )
+        after = (0, -1)
+        while True:
+            async with self.db_pool.acquire() as conn:
+                rows = await conn.fetch(query, *params, *after, ZONE_CURSOR_PREFETCH)
+            for row in rows:
+                yield self._to_response(_zone_from_row(row))
+            if len(rows) < ZONE_CURSOR_PREFETCH:
+                return
+            after = (rows[-1]['page_number'], rows[-1]['zone_index'])
     
     async def create_zone(self, zone_data: ZoneCreate) -> ZoneResponse:
         """Create a new zone"""
@@ -155,28 +690,15 @@ class ZoneService:
             
             # Force demo mode for Epic 6 testing
             self._demo_zones[zone_id] = zone
+            self._zones_by_document[zone.document_id].add(zone_id)
+            
+            # The document's cached zone lists no longer include this zone
+            if self.redis:
+                await self._clear_zone_cache(zone_id, zone.document_id)
             
             logger.info(f"Created zone {zone_id} for document {zone.document_id}")
             
-            # Create response manually to avoid enum issues
-            return ZoneResponse(
-                id=zone.id,
-                created_at=zone.created_at,
-                updated_at=zone.updated_at,
-                document_id=zone.document_id,
-                zone_index=zone.zone_index,
-                page_number=zone.page_number,
-                zone_type=zone.zone_type,
-                coordinates=zone.coordinates,
-                content=zone.content,
-                confidence=zone.confidence,
-                processing_tool=zone.processing_tool,
-                status=zone.status,
-                metadata=zone.metadata,
-                content_preview=zone.content[:100] + ('...' if zone.content and len(zone.content) > 100 else '') if zone.content else 'No content',
-                word_count=len(zone.content.split()) if zone.content else 0,
-                character_count=len(zone.content) if zone.content else 0
-            )
+            return self._to_response(zone)
             
         except Exception as e:
             import traceback
@@ -191,25 +713,17 @@ class ZoneService:
     async def get_zone(self, zone_id: UUID) -> ZoneResponse:
         """Get a specific zone by ID"""
         try:
-            zone = None
-            
-            if self.db_pool:
-                async with self.db_pool.acquire() as conn:
-                    row = await conn.fetchrow(
-                        "SELECT * FROM zones WHERE id = $1",
-                        zone_id
-                    )
-                    if row:
-                        zone_dict = dict(row)
-                        zone_dict['coordinates'] = ZoneCoordinates(**zone_dict['coordinates'])
-                        zone = Zone(**zone_dict)
-            else:
-                zone = self._demo_zones.get(zone_id)
+            zone = await self._get_zone_internal(zone_id)
             
             if not zone:
                 raise ZoneNotFoundError(zone_id)
             
-            return ZoneResponse(**zone.model_dump())
+            # Opening a zone is usually followed by listing its document's zones,
+            # so bring an already cached list close while the zone is returned
+            if self.db_pool and self.redis:
+                self._prefetch_zone_list(zone.document_id)
+            
+            return self._to_response(zone)
             
         except ZoneNotFoundError:
             raise
@@ -224,50 +738,27 @@ class ZoneService:
     ) -> ZoneResponse:
         """Update a zone"""
         try:
-            # Get existing zone
-            existing_zone = await self._get_zone_internal(zone_id)
-            if not existing_zone:
-                raise ZoneNotFoundError(zone_id)
-            
-            # Update fields
-            update_data = zone_update.model_dump(exclude_none=True)
-            update_data['updated_at'] = datetime.utcnow()
+            now = datetime.utcnow()
             
             if self.db_pool:
-                # Build dynamic update query
-                set_clauses = []
-                params = [zone_id]
-                param_count = 2
-                
-                for field, value in update_data.items():
-                    if field == 'coordinates':
-                        set_clauses.append(f"{field} = ${param_count}::jsonb")
-                        params.append(json.dumps(value.model_dump() if hasattr(value, 'model_dump') else value))
-                    elif field == 'metadata':
-                        set_clauses.append(f"{field} = ${param_count}::jsonb")
-                        params.append(json.dumps(value))
-                    elif field in ['zone_type', 'status']:
-                        set_clauses.append(f"{field} = ${param_count}")
-                        params.append(value.value if hasattr(value, 'value') else value)
-                    else:
-                        set_clauses.append(f"{field} = ${param_count}")
-                        params.append(value)
-                    param_count += 1
-                
-                query = f"""
-                    UPDATE zones 
-                    SET {', '.join(set_clauses)}
-                    WHERE id = $1
-                    RETURNING *
-                """
+                # Pick the pregenerated UPDATE for the fields being set; no row
+                # back means the zone does not exist
+                mask, values = _zone_update_params(zone_update)
                 
                 async with self.db_pool.acquire() as conn:
-                    row = await conn.fetchrow(query, *params)
-                    zone_dict = dict(row)
-                    zone_dict['coordinates'] = ZoneCoordinates(**zone_dict['coordinates'])
-                    zone = Zone(**zone_dict)
+                    row = await conn.fetchrow(
+                        _UPDATE_ZONE_SQL[mask], zone_id, now, *values
+                    )
+                if row is None:
+                    raise ZoneNotFoundError(zone_id)
+                zone = _zone_from_row(row)
             else:
                 # Demo mode
+                existing_zone = self._demo_zones.get(zone_id)
+                if not existing_zone:
+                    raise ZoneNotFoundError(zone_id)
+                update_data = zone_update.model_dump(exclude_none=True)
+                update_data['updated_at'] = now
                 for field, value in update_data.items():
                     setattr(existing_zone, field, value)
                 zone = existing_zone
@@ -279,7 +770,7 @@ class ZoneService:
             
             logger.info(f"Updated zone {zone_id}")
             
-            return ZoneResponse(**zone.model_dump())
+            return self._to_response(zone)
             
         except ZoneNotFoundError:
             raise
@@ -302,12 +793,16 @@ class ZoneService:
             if not existing_zone:
                 raise ZoneNotFoundError(zone_id)
             
-            # Check for conflicts if we have a conflict resolver
+            # Check for conflicts if we have a conflict resolver; an up-to-date
+            # client's version is bumped by the same atomic check
             conflict = None
+            new_version = None
             if self.conflict_resolver and version is not None:
-                current_version = self._zone_versions.get(str(zone_id), 0)
+                bumped, current_version = await self._check_and_bump_zone_version(zone_id, version)
                 
-                if version < current_version:
+                if bumped:
+                    new_version = current_version
+                else:
                     # Detect conflict
                     local_changes = zone_update.model_dump(exclude_none=True)
                     
@@ -321,7 +816,6 @@ class ZoneService:
                     
                     if conflict:
                         # Try to resolve
-                        from ..websocket.conflict_resolver import ConflictResolutionStrategy
                         resolved_changes, requires_intervention = self.conflict_resolver.resolve_conflict(
                             conflict,
                             local_changes,
@@ -345,8 +839,8 @@ class ZoneService:
             updated_zone = await self.update_zone(zone_id, zone_update)
             
             # Update version
-            new_version = self._zone_versions.get(str(zone_id), 0) + 1
-            self._zone_versions[str(zone_id)] = new_version
+            if new_version is None:
+                new_version = await self._bump_zone_version(zone_id)
             
             # Broadcast update if we have a connection manager
             if self.connection_manager:
@@ -374,6 +868,41 @@ class ZoneService:
             logger.error(f"Error in collaborative zone update {zone_id}: {str(e)}")
             raise
     
+    async def _check_and_bump_zone_version(self, zone_id: UUID, version: int) -> Tuple[bool, int]:
+        """Bump a zone's version unless the client's is stale; returns (bumped, version)"""
+        if self.redis:
+            try:
+                bumped, current = await self.redis.eval(
+                    _ZONE_VERSION_CHECK_AND_BUMP, 1,
+                    _zone_version_key(zone_id), version, ZONE_VERSION_TTL
+                )
+                return bool(bumped), int(current)
+            except Exception as e:
+                logger.warning("Zone version check failed for %s: %s", zone_id, e)
+        
+        current = self._zone_versions.get(str(zone_id), 0)
+        if version < current:
+            return False, current
+        self._zone_versions[str(zone_id)] = current + 1
+        return True, current + 1
+    
+    async def _bump_zone_version(self, zone_id: UUID) -> int:
+        """Unconditionally bump a zone's version and return the new one"""
+        if self.redis:
+            try:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    key = _zone_version_key(zone_id)
+                    pipe.incr(key)
+                    pipe.expire(key, ZONE_VERSION_TTL)
+                    new_version, _ = await pipe.execute()
+                return int(new_version)
+            except Exception as e:
+                logger.warning("Zone version bump failed for %s: %s", zone_id, e)
+        
+        new_version = self._zone_versions.get(str(zone_id), 0) + 1
+        self._zone_versions[str(zone_id)] = new_version
+        return new_version
+    
     async def lock_zone(self, zone_id: UUID, user_id: str) -> bool:
         """Lock a zone for exclusive editing"""
         if self.conflict_resolver:
@@ -383,8 +912,6 @@ class ZoneService:
                 # Broadcast lock event
                 zone = await self._get_zone_internal(zone_id)
                 if zone:
-                    from ..websocket.events import ZoneCollaborationEvent, EventType
-                    
                     await self.connection_manager.broadcast_to_room(
                         f"document_{zone.document_id}",
                         ZoneCollaborationEvent(
@@ -409,8 +936,6 @@ class ZoneService:
                 # Broadcast unlock event
                 zone = await self._get_zone_internal(zone_id)
                 if zone:
-                    from ..websocket.events import ZoneCollaborationEvent, EventType
-                    
                     await self.connection_manager.broadcast_to_room(
                         f"document_{zone.document_id}",
                         ZoneCollaborationEvent(
@@ -428,22 +953,21 @@ class ZoneService:
     async def delete_zone(self, zone_id: UUID) -> bool:
         """Delete a zone"""
         try:
-            zone = await self._get_zone_internal(zone_id)
-            if not zone:
-                raise ZoneNotFoundError(zone_id)
-            
             if self.db_pool:
                 async with self.db_pool.acquire() as conn:
-                    await conn.execute(
-                        "DELETE FROM zones WHERE id = $1",
-                        zone_id
-                    )
+                    document_id = await conn.fetchval(_DELETE_ZONE_SQL, zone_id)
+                if document_id is None:
+                    raise ZoneNotFoundError(zone_id)
             else:
-                del self._demo_zones[zone_id]
+                zone = self._demo_zones.pop(zone_id, None)
+                if not zone:
+                    raise ZoneNotFoundError(zone_id)
+                self._zones_by_document[zone.document_id].discard(zone_id)
+                document_id = zone.document_id
             
             # Clear cache
             if self.redis:
-                await self._clear_zone_cache(zone_id, zone.document_id)
+                await self._clear_zone_cache(zone_id, document_id)
             
             logger.info(f"Deleted zone {zone_id}")
             return True
@@ -473,43 +997,74 @@ class ZoneService:
             
             if not request.force_update and zone.status == ZoneStatus.COMPLETED:
                 logger.info(f"Zone {zone_id} already processed, skipping reprocess")
-                return await self.get_zone(zone_id)
+                return self._to_response(zone)
             
-            # Update zone status to processing
-            await self.update_zone(
-                zone_id,
-                ZoneUpdate(
-                    status=ZoneStatus.PROCESSING,
-                    metadata={
-                        **zone.metadata,
-                        "reprocess_requested_at": datetime.utcnow().isoformat(),
-                        "reprocess_tools": request.tools,
-                        "reprocess_options": request.options
-                    }
-                )
-            )
+            processing_tool = request.tools[0] if request.tools else "auto"
+            
+            # The PROCESSING state is transient, so announce it to the document's
+            # room instead of writing it
+            if self.connection_manager:
+                try:
+                    await self.connection_manager.broadcast_to_room(
+                        f"document_{zone.document_id}",
+                        ZoneProcessingEvent(
+                            type=EventType.ZONE_PROCESSING_STARTED,
+                            document_id=str(zone.document_id),
+                            zone_id=str(zone_id),
+                            zone_index=zone.zone_index,
+                            processing_tool=processing_tool,
+                            status=ZoneStatus.PROCESSING.value
+                        )
+                    )
+                except Exception as e:
+                    logger.warning("Failed to broadcast processing state for zone %s: %s", zone_id, e)
             
             # TODO: Trigger actual reprocessing job
             # For now, we'll just simulate completion
             logger.info(f"Zone {zone_id} queued for reprocessing with tools: {request.tools}")
             
-            # Simulate processing completion
-            await self.update_zone(
+            # Simulate processing completion, written in a single UPDATE
+            now = datetime.utcnow()
+            now_iso = now.isoformat()
+            reprocess_metadata = {
+                "reprocess_requested_at": now_iso,
+                "reprocess_tools": request.tools,
+                "reprocess_options": request.options,
+                "reprocess_completed_at": now_iso
+            }
+            
+            if self.db_pool:
+                # Merge the new keys into metadata server-side, so the zone read
+                # above (possibly from cache) never overwrites newer metadata
+                async with self.db_pool.acquire() as conn:
+                    row = await conn.fetchrow(
+                        _REPROCESS_ZONE_SQL,
+                        zone_id,
+                        now,
+                        ZoneStatus.COMPLETED.value,
+                        processing_tool,
+                        0.95,  # Simulated confidence
+                        "Reprocessed content placeholder",  # Simulated content
+                        _json_dumps(reprocess_metadata)
+                    )
+                if row is None:
+                    raise ZoneNotFoundError(zone_id)
+                if self.redis:
+                    await self._clear_zone_cache(zone_id, zone.document_id)
+                return self._to_response(_zone_from_row(row))
+            
+            # Every value is built here, so skip re-validating (and re-copying) metadata
+            return await self.update_zone(
                 zone_id,
-                ZoneUpdate(
+                ZoneUpdate.model_construct(
                     status=ZoneStatus.COMPLETED,
-                    processing_tool=request.tools[0] if request.tools else "auto",
+                    processing_tool=processing_tool,
                     confidence=0.95,  # Simulated confidence
                     content="Reprocessed content placeholder",  # Simulated content
-                    metadata={
-                        **zone.metadata,
-                        "reprocess_completed_at": datetime.utcnow().isoformat()
-                    }
+                    metadata={**zone.metadata, **reprocess_metadata}
                 )
             )
             
-            return await self.get_zone(zone_id)
-            
         except (ZoneNotFoundError, InvalidZoneOperationError):
             raise
         except Exception as e:
@@ -535,8 +1090,17 @@ class ZoneService:
                 request.split_count
             )
             
+            # Everything but the index is shared by the new zones
+            split_at = datetime.utcnow().isoformat()
+            base_metadata = {
+                **zone.metadata,
+                "split_from_zone": str(zone_id),
+                "split_type": request.split_type,
+                "split_at": split_at
+            }
+            
             # Create new zones
-            new_zones = []
+            zones_data = []
             for i, coords in enumerate(new_coordinates):
                 # Calculate new zone index
                 new_zone_index = zone.zone_index * 100 + i + 1  # Avoid index conflicts
@@ -551,20 +1115,26 @@ class ZoneService:
                     content=None,  # Content will need to be reprocessed
                     confidence=None,
                     processing_tool=None,
-                    metadata={
-                        **zone.metadata,
-                        "split_from_zone": str(zone_id),
-                        "split_index": i,
-                        "split_type": request.split_type,
-                        "split_at": datetime.utcnow().isoformat()
-                    }
+                    metadata={**base_metadata, "split_index": i}
                 )
-                
-                new_zone = await self.create_zone(zone_data)
-                new_zones.append(new_zone)
+                zones_data.append(zone_data)
             
-            # Delete original zone
-            await self.delete_zone(zone_id)
+            if self.db_pool:
+                # Insert the pieces and delete the original in one transaction,
+                # so the swap is atomic and costs a single commit
+                async with self.db_pool.acquire() as conn:
+                    async with conn.transaction():
+                        new_zones = await self._create_zones_bulk(
+                            zones_data, ZoneStatus.PENDING, conn
+                        )
+                        await self._delete_zones_bulk([zone_id], zone.document_id, conn)
+                if self.redis:
+                    await self._clear_zones_cache_bulk([zone_id], [zone.document_id])
+            else:
+                new_zones = [await self.create_zone(zone_data) for zone_data in zones_data]
+                
+                # Delete original zone (existence was checked above)
+                await self._delete_zones_bulk([zone_id], zone.document_id)
             
             logger.info(f"Split zone {zone_id} into {len(new_zones)} zones")
             
@@ -574,7 +1144,7 @@ class ZoneService:
                 split_metadata={
                     "split_type": request.split_type,
                     "split_count": len(new_zones),
-                    "split_at": datetime.utcnow().isoformat()
+                    "split_at": split_at
                 }
             )
             
@@ -590,13 +1160,12 @@ class ZoneService:
     ) -> ZoneMergeResponse:
         """Merge multiple zones into one"""
         try:
-            # Fetch all zones to merge
-            zones = []
+            # Fetch all zones to merge in one query, keeping the requested order
+            zones_by_id = await self._get_zones_internal(request.zone_ids)
             for zone_id in request.zone_ids:
-                zone = await self._get_zone_internal(zone_id)
-                if not zone:
+                if zone_id not in zones_by_id:
                     raise ZoneNotFoundError(zone_id)
-                zones.append(zone)
+            zones = [zones_by_id[zone_id] for zone_id in request.zone_ids]
             
             # Validate zones can be merged
             document_id = zones[0].document_id
@@ -628,7 +1197,8 @@ class ZoneService:
             confidences = [z.confidence for z in zones if z.confidence is not None]
             avg_confidence = sum(confidences) / len(confidences) if confidences else None
             
-            # Create merged zone
+            # Create merged zone; the metadata and the response share one timestamp
+            merged_at = datetime.utcnow().isoformat()
             merged_zone_data = ZoneCreate(
                 document_id=document_id,
                 zone_index=min(z.zone_index for z in zones),
@@ -641,16 +1211,28 @@ class ZoneService:
                 metadata={
                     "merged_from_zones": [str(z.id) for z in zones],
                     "merge_strategy": request.merge_strategy,
-                    "merged_at": datetime.utcnow().isoformat(),
+                    "merged_at": merged_at,
                     "original_metadata": [z.metadata for z in zones]
                 }
             )
             
-            merged_zone = await self.create_zone(merged_zone_data)
-            
-            # Delete original zones
-            for zone_id in request.zone_ids:
-                await self.delete_zone(zone_id)
+            if self.db_pool:
+                # The merged zone takes the lowest original zone_index, so the
+                # originals are deleted first; one transaction keeps the swap
+                # atomic and costs a single commit
+                async with self.db_pool.acquire() as conn:
+                    async with conn.transaction():
+                        await self._delete_zones_bulk(request.zone_ids, document_id, conn)
+                        merged_zone, = await self._create_zones_bulk(
+                            [merged_zone_data], ZoneStatus.COMPLETED, conn
+                        )
+                if self.redis:
+                    await self._clear_zones_cache_bulk(request.zone_ids, [document_id])
+            else:
+                merged_zone = await self.create_zone(merged_zone_data)
+                
+                # Delete original zones (existence was checked above)
+                await self._delete_zones_bulk(request.zone_ids, document_id)
             
             logger.info(f"Merged {len(zones)} zones into zone {merged_zone.id}")
             
@@ -660,7 +1242,7 @@ class ZoneService:
                 merge_metadata={
                     "merge_strategy": request.merge_strategy,
                     "zones_merged": len(zones),
-                    "merged_at": datetime.utcnow().isoformat()
+                    "merged_at": merged_at
                 }
             )
             
@@ -675,24 +1257,44 @@ class ZoneService:
         request: ZoneBatchUpdateRequest
     ) -> ZoneBatchUpdateResponse:
         """Batch update multiple zones"""
+        if self.db_pool:
+            return await self._batch_update_zones_sql(request)
+        
         updated_zones = []
         failed_zones = []
         
-        for zone_id in request.zone_ids:
-            try:
-                # Create ZoneUpdate from the update data
-                zone_update = ZoneUpdate(**request.update_data)
-                
-                # Update the zone
-                await self.update_zone(zone_id, zone_update)
-                updated_zones.append(zone_id)
-                
-            except Exception as e:
-                logger.error(f"Failed to update zone {zone_id}: {str(e)}")
+        # The same update applies to every zone, so validate it once
+        try:
+            zone_update = ZoneUpdate(**request.update_data)
+        except Exception as e:
+            logger.error(f"Failed to batch update zones: {str(e)}")
+            return self._failed_batch_response(request.zone_ids, e)
+        
+        # Demo mode: updates run concurrently, a bounded number at a time
+        semaphore = asyncio.Semaphore(DEMO_BATCH_CONCURRENCY)
+        
+        async def update_one(zone_id: UUID) -> ZoneResponse:
+            async with semaphore:
+                return await self.update_zone(zone_id, zone_update)
+        
+        results = await asyncio.gather(
+            *(update_one(zone_id) for zone_id in request.zone_ids),
+            return_exceptions=True
+        )
+        
+        updated_by_document: Dict[UUID, List[UUID]] = defaultdict(list)
+        for zone_id, result in zip(request.zone_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to update zone {zone_id}: {str(result)}")
                 failed_zones.append({
                     "zone_id": str(zone_id),
-                    "error": str(e)
+                    "error": str(result)
                 })
+            else:
+                updated_zones.append(zone_id)
+                updated_by_document[result.document_id].append(zone_id)
+        
+        await self._broadcast_batch_update(updated_by_document, zone_update)
         
         return ZoneBatchUpdateResponse(
             updated_count=len(updated_zones),
@@ -701,34 +1303,162 @@ class ZoneService:
             failed_zones=failed_zones
         )
     
+    @staticmethod
+    def _failed_batch_response(zone_ids: List[UUID], error: Exception) -> ZoneBatchUpdateResponse:
+        """Batch response reporting every zone as failed with the same error"""
+        return ZoneBatchUpdateResponse(
+            updated_count=0,
+            failed_count=len(zone_ids),
+            updated_zones=[],
+            failed_zones=[
+                {"zone_id": str(zone_id), "error": str(error)} for zone_id in zone_ids
+            ]
+        )
+    
+    async def _batch_update_zones_sql(
+        self,
+        request: ZoneBatchUpdateRequest
+    ) -> ZoneBatchUpdateResponse:
+        """Apply one update to every zone with a single UPDATE ... WHERE id = ANY($1)"""
+        try:
+            zone_update = ZoneUpdate(**request.update_data)
+            mask, values = _zone_update_params(zone_update)
+            
+            async with self.db_pool.acquire() as conn:
+                async with conn.transaction():
+                    rows = await conn.fetch(
+                        _BATCH_UPDATE_ZONE_SQL[mask],
+                        request.zone_ids, datetime.utcnow(), *values
+                    )
+        except Exception as e:
+            logger.error(f"Failed to batch update zones: {str(e)}")
+            return self._failed_batch_response(request.zone_ids, e)
+        
+        updated_ids = {row['id'] for row in rows}
+        updated_zones = [zone_id for zone_id in request.zone_ids if zone_id in updated_ids]
+        failed_zones = [
+            {"zone_id": str(zone_id), "error": f"Zone {zone_id} not found"}
+            for zone_id in request.zone_ids if zone_id not in updated_ids
+        ]
+        
+        if self.redis:
+            await self._clear_zones_cache_bulk(
+                (row['id'] for row in rows), (row['document_id'] for row in rows), background=True
+            )
+        
+        if self.connection_manager:
+            updated_by_document: Dict[UUID, List[UUID]] = defaultdict(list)
+            for row in rows:
+                updated_by_document[row['document_id']].append(row['id'])
+            await self._broadcast_batch_update(updated_by_document, zone_update)
+        
+        return ZoneBatchUpdateResponse(
+            updated_count=len(updated_zones),
+            failed_count=len(failed_zones),
+            updated_zones=updated_zones,
+            failed_zones=failed_zones
+        )
+    
+    async def _broadcast_batch_update(
+        self,
+        updated_by_document: Dict[UUID, List[UUID]],
+        zone_update: ZoneUpdate
+    ):
+        """Announce a batch update with one event per document rather than per zone"""
+        if not self.connection_manager or not updated_by_document:
+            return
+        
+        zone_data = zone_update.model_dump(mode="json", exclude_none=True)
+        for document_id, zone_ids in updated_by_document.items():
+            try:
+                await self.connection_manager.broadcast_zone_batch_update(
+                    None,
+                    str(document_id),
+                    [str(zone_id) for zone_id in zone_ids],
+                    zone_data
+                )
+            except Exception as e:
+                logger.warning("Failed to broadcast batch update for document %s: %s", document_id, e)
+    
     # Helper methods
     async def _get_zone_internal(self, zone_id: UUID) -> Optional[Zone]:
         """Internal method to get zone without converting to response"""
         if self.db_pool:
-            async with self.db_pool.acquire() as conn:
-                row = await conn.fetchrow(
-                    "SELECT * FROM zones WHERE id = $1",
-                    zone_id
-                )
-                if row:
-                    zone_dict = dict(row)
-                    zone_dict['coordinates'] = ZoneCoordinates(**zone_dict['coordinates'])
-                    return Zone(**zone_dict)
+            return await self._cached_zone(zone_id)
         else:
             return self._demo_zones.get(zone_id)
         return None
     
-    def _get_content_preview(self, content: Optional[str]) -> str:
-        """Get preview of zone content"""
-        if not content:
-            return "No content extracted"
-        return content[:100] + ('...' if len(content) > 100 else '')
+    async def _cached_zone(self, zone_id: UUID) -> Optional[Zone]:
+        """Read a zone through the zone:{id} cache, filling it from the database on a miss"""
+        cache_key = _zone_key(zone_id)
+        # Memoized only alongside Redis, whose invalidation also clears the memo
+        memo = get_request_cache() if self.redis else None
+        if memo is not None and cache_key in memo:
+            return memo[cache_key]
+        
+        zone = await self._read_zone(cache_key, zone_id)
+        if memo is not None and zone is not None:
+            memo[cache_key] = zone
+        return zone
     
-    def _get_word_count(self, content: Optional[str]) -> int:
-        """Get word count of content"""
+    async def _read_zone(self, cache_key: str, zone_id: UUID) -> Optional[Zone]:
+        """Read one zone from Redis, falling back to the database and refilling Redis"""
+        if self.redis:
+            try:
+                cached = await self.redis.get(cache_key)
+                if cached:
+                    return Zone.model_validate_json(cached)
+            except Exception as e:
+                logger.warning("Zone cache read failed for %s: %s", zone_id, e)
+        
+        async with self.db_pool.acquire() as conn:
+            row = await conn.fetchrow(_SELECT_ZONE_SQL, zone_id)
+        if not row:
+            return None
+        
+        zone = _zone_from_row(row)
+        
+        if self.redis:
+            try:
+                await self.redis.set(cache_key, zone.model_dump_json(), ex=ZONE_CACHE_TTL)
+            except Exception as e:
+                logger.warning("Zone cache write failed for %s: %s", zone_id, e)
+        return zone
+    
+    async def _get_zones_internal(self, zone_ids: List[UUID]) -> Dict[UUID, Zone]:
+        """Fetch several zones in one round trip, keyed by id (missing ids are absent)"""
+        if self.db_pool:
+            async with self.db_pool.acquire() as conn:
+                rows = await conn.fetch(_SELECT_ZONES_SQL, zone_ids)
+            return {row['id']: _zone_from_row(row) for row in rows}
+        
+        return {
+            zone_id: self._demo_zones[zone_id]
+            for zone_id in zone_ids if zone_id in self._demo_zones
+        }
+    
+    def _to_response(self, zone: Zone) -> ZoneResponse:
+        """Build a zone response without dumping or re-validating the zone"""
+        content_preview, word_count, character_count = self._content_stats(zone.content)
+        return ZoneResponse.model_construct(
+            **dict(zone),
+            content_preview=content_preview,
+            word_count=word_count,
+            character_count=character_count
+        )
+    
+    @staticmethod
+    def _content_stats(content: Optional[str]) -> Tuple[str, int, int]:
+        """Preview, word count and character count of zone content"""
         if not content:
-            return 0
-        return len(content.split())
+            return "No content", 0, 0
+        length = len(content)
+        preview = content[:100] + '...' if length > 100 else content
+        if length < _WORD_COUNT_SCAN_THRESHOLD:
+            return preview, len(content.split()), length
+        # Count matches one at a time rather than building a list of every word
+        return preview, sum(1 for _ in _WORD_RE.finditer(content)), length
     
     def _calculate_split_coordinates(
         self,
@@ -765,19 +1495,22 @@ class ZoneService:
                     page_height=original.page_height
                 ))
             else:
-                # Split into equal parts
+                # Split into equal parts; every piece is a positive fraction of
+                # the already validated original, so none is re-validated
                 count = split_count or 2
                 height_per_zone = original.height / count
                 
-                for i in range(count):
-                    coords_list.append(ZoneCoordinates(
+                coords_list = [
+                    ZoneCoordinates.model_construct(
                         x=original.x,
                         y=original.y + (i * height_per_zone),
                         width=original.width,
                         height=height_per_zone,
                         page_width=original.page_width,
                         page_height=original.page_height
-                    ))
+                    )
+                    for i in range(count)
+                ]
         
         elif split_type == "vertical":
             if split_position:
@@ -804,60 +1537,39 @@ class ZoneService:
                     page_height=original.page_height
                 ))
             else:
-                # Split into equal parts
+                # Split into equal parts (see the horizontal case)
                 count = split_count or 2
                 width_per_zone = original.width / count
                 
-                for i in range(count):
-                    coords_list.append(ZoneCoordinates(
+                coords_list = [
+                    ZoneCoordinates.model_construct(
                         x=original.x + (i * width_per_zone),
                         y=original.y,
                         width=width_per_zone,
                         height=original.height,
                         page_width=original.page_width,
                         page_height=original.page_height
-                    ))
+                    )
+                    for i in range(count)
+                ]
         
         elif split_type == "auto":
             # For auto split, we'll just do a simple 2x2 grid for now
             # In a real implementation, this would use ML to detect natural boundaries
+            half_width = original.width / 2
+            half_height = original.height / 2
             coords_list = [
-                # Top-left
-                ZoneCoordinates(
-                    x=original.x,
-                    y=original.y,
-                    width=original.width / 2,
-                    height=original.height / 2,
-                    page_width=original.page_width,
-                    page_height=original.page_height
-                ),
-                # Top-right
-                ZoneCoordinates(
-                    x=original.x + original.width / 2,
-                    y=original.y,
-                    width=original.width / 2,
-                    height=original.height / 2,
-                    page_width=original.page_width,
-                    page_height=original.page_height
-                ),
-                # Bottom-left
-                ZoneCoordinates(
-                    x=original.x,
-                    y=original.y + original.height / 2,
-                    width=original.width / 2,
-                    height=original.height / 2,
-                    page_width=original.page_width,
-                    page_height=original.page_height
-                ),
-                # Bottom-right
-                ZoneCoordinates(
-                    x=original.x + original.width / 2,
-                    y=original.y + original.height / 2,
-                    width=original.width / 2,
-                    height=original.height / 2,
+                ZoneCoordinates.model_construct(
+                    x=original.x + dx,
+                    y=original.y + dy,
+                    width=half_width,
+                    height=half_height,
                     page_width=original.page_width,
                     page_height=original.page_height
                 )
+                # Top-left, top-right, bottom-left, bottom-right
+                for dy in (0, half_height)
+                for dx in (0, half_width)
             ]
         
         return coords_list
@@ -870,18 +1582,30 @@ class ZoneService:
         if not coords_list:
             raise ValueError("No coordinates to merge")
         
-        min_x = min(c.x for c in coords_list)
-        min_y = min(c.y for c in coords_list)
-        max_x = max(c.x + c.width for c in coords_list)
-        max_y = max(c.y + c.height for c in coords_list)
+        # One pass tracking all four bounds
+        first = coords_list[0]
+        min_x, min_y = first.x, first.y
+        max_x, max_y = first.x + first.width, first.y + first.height
+        for c in coords_list[1:]:
+            x, y = c.x, c.y
+            if x < min_x:
+                min_x = x
+            if y < min_y:
+                min_y = y
+            right, bottom = x + c.width, y + c.height
+            if right > max_x:
+                max_x = right
+            if bottom > max_y:
+                max_y = bottom
         
-        return ZoneCoordinates(
+        # The box of validated coordinates is itself valid, so skip re-validating it
+        return ZoneCoordinates.model_construct(
             x=min_x,
             y=min_y,
             width=max_x - min_x,
             height=max_y - min_y,
-            page_width=coords_list[0].page_width,
-            page_height=coords_list[0].page_height
+            page_width=first.page_width,
+            page_height=first.page_height
         )
     
     def _merge_content(
@@ -891,7 +1615,8 @@ class ZoneService:
         preserve_formatting: bool
     ) -> Optional[str]:
         """Merge content from multiple zones"""
-        contents = [z.content for z in zones if z.content]
+        # Gathered by C-level map/filter rather than a per-zone comprehension
+        contents = list(filter(None, map(attrgetter("content"), zones)))
         
         if not contents:
             return None
@@ -904,60 +1629,202 @@ class ZoneService:
         elif strategy == "smart":
             # Smart merge based on zone types
             # Group by zone type and merge appropriately
-            grouped = {}
+            # ZoneType is a str enum, so its members key the groups (and
+            # _MERGE_SEPARATORS) directly without resolving .value per zone
+            grouped = defaultdict(list)
             for zone in zones:
                 if zone.content:
-                    zone_type = zone.zone_type.value if hasattr(zone.zone_type, 'value') else str(zone.zone_type)
-                    if zone_type not in grouped:
-                        grouped[zone_type] = []
-                    grouped[zone_type].append(zone.content)
-            
-            # Merge each group
-            merged_parts = []
-            for zone_type, contents in grouped.items():
-                if zone_type == "text":
-                    merged_parts.append("\n\n".join(contents))
-                elif zone_type == "table":
-                    # For tables, try to preserve structure
-                    merged_parts.append("\n".join(contents))
-                else:
-                    merged_parts.append("\n".join(contents))
-            
-            return "\n\n".join(merged_parts)
+                    grouped[zone.zone_type].append(zone.content)
+            
+            # Merge each group, laying the contents and separators out flat so
+            # the text is copied by a single join
+            parts = []
+            for zone_type, group in grouped.items():
+                separator = _MERGE_SEPARATORS.get(zone_type, "\n")
+                for content in group:
+                    parts.append(content)
+                    parts.append(separator)
+                # Groups are separated by a blank line
+                parts[-1] = "\n\n"
+            parts.pop()
+            
+            return "".join(parts)
         
         elif strategy == "preserve_layout":
-            # Sort zones by position and merge
-            sorted_zones = sorted(zones, key=lambda z: (z.coordinates.y, z.coordinates.x))
-            contents = [z.content for z in sorted_zones if z.content]
-            return "\n".join(contents)
+            # Sort by position: coordinates are read once per zone, and the
+            # sort compares plain float pairs through a C key function
+            positioned = [
+                (z.coordinates.y, z.coordinates.x, z.content) for z in zones if z.content
+            ]
+            if NUMPY_AVAILABLE and len(positioned) >= _NUMPY_SORT_THRESHOLD:
+                return "\n".join(self._layout_order_numpy(positioned))
+            positioned.sort(key=itemgetter(0, 1))
+            return "\n".join(map(itemgetter(2), positioned))
         
-        return "\n".join(contents)
+        # ZoneMergeRequest only admits the strategies above
+        raise ValueError(f"Unknown merge strategy: {strategy}")
+    
+    @staticmethod
+    def _layout_order_numpy(positioned: List[Tuple[float, float, str]]) -> List[str]:
+        """Contents of (y, x, content) tuples in reading order, sorted by one C lexsort"""
+        count = len(positioned)
+        ys = np.fromiter(map(itemgetter(0), positioned), dtype=np.float64, count=count)
+        xs = np.fromiter(map(itemgetter(1), positioned), dtype=np.float64, count=count)
+        # lexsort is stable and sorts by its last key first: y, then x
+        return [positioned[i][2] for i in np.lexsort((xs, ys)).tolist()]
     
     def _determine_merged_type(self, zones: List[Zone]) -> ZoneType:
         """Determine the type for merged zone"""
-        # Count zone types
-        type_counts = {}
-        for zone in zones:
-            zone_type = zone.zone_type
-            type_counts[zone_type] = type_counts.get(zone_type, 0) + 1
+        if not zones:
+            return ZoneType.UNKNOWN
+        types = list(map(attrgetter("zone_type"), zones))
+        
+        # Merges of same-type zones are the common case and need no counting;
+        # list.count runs the equality checks in C instead of a generator
+        if types.count(types[0]) == len(types):
+            return types[0]
+        
+        # Most common type; ties go to the type seen first
+        return Counter(types).most_common(1)[0][0]
+    
+    @asynccontextmanager
+    async def _conn(self, conn: Optional[asyncpg.Connection] = None):
+        """Yield the caller's connection if given, otherwise acquire one from the pool"""
+        if conn is not None:
+            yield conn
+        else:
+            async with self.db_pool.acquire() as acquired:
+                yield acquired
+    
+    async def _create_zones_bulk(
+        self,
+        zones_data: List[ZoneCreate],
+        status: ZoneStatus = ZoneStatus.PENDING,
+        conn: Optional[asyncpg.Connection] = None
+    ) -> List[ZoneResponse]:
+        """Insert several zones with one multi-row INSERT ... SELECT FROM UNNEST
+        
+        With a caller's connection (typically inside its transaction) the cache
+        is left alone; the caller invalidates once it has committed.
+        """
+        now = datetime.utcnow()
+        zone_ids = [uuid4() for _ in zones_data]
+        
+        async with self._conn(conn) as conn_:
+            await conn_.execute("""
+                INSERT INTO zones (
+                    id, document_id, zone_index, page_number, zone_type, coordinates,
+                    content, confidence, processing_tool, status, metadata,
+                    created_at, updated_at
+                )
+                SELECT t.id, t.document_id, t.zone_index, t.page_number, t.zone_type::zone_type,
+                       t.coordinates::jsonb, t.content, t.confidence, t.processing_tool,
+                       $11::zone_status, t.metadata::jsonb, $12, $12
+                FROM UNNEST(
+                    $1::uuid[], $2::uuid[], $3::int[], $4::int[], $5::text[],
+                    $6::text[], $7::text[], $8::float8[], $9::text[], $10::text[]
+                ) AS t(
+                    id, document_id, zone_index, page_number, zone_type,
+                    coordinates, content, confidence, processing_tool, metadata
+                )
+            """,
+                zone_ids,
+                [z.document_id for z in zones_data],
+                [z.zone_index for z in zones_data],
+                [z.page_number for z in zones_data],
+                # Validated ZoneCreates hold plain strings (use_enum_values)
+                [ZoneType(z.zone_type).value for z in zones_data],
+                [z.coordinates.model_dump_json() for z in zones_data],
+                [z.content for z in zones_data],
+                [z.confidence for z in zones_data],
+                [z.processing_tool for z in zones_data],
+                [_json_dumps(z.metadata) for z in zones_data],
+                ZoneStatus(status).value,
+                now
+            )
+        
+        if self.redis and conn is None:
+            await self._clear_zones_cache_bulk([], (z.document_id for z in zones_data))
+        
+        return [
+            self._to_response(Zone.model_construct(
+                id=zone_id,
+                created_at=now,
+                updated_at=now,
+                status=status,
+                **dict(zone_data)
+            ))
+            for zone_id, zone_data in zip(zone_ids, zones_data)
+        ]
+    
+    async def _delete_zones_bulk(
+        self,
+        zone_ids: List[UUID],
+        document_id: UUID,
+        conn: Optional[asyncpg.Connection] = None
+    ):
+        """Delete zones of one document with a single DELETE and one cache round trip
         
-        # Return most common type
-        if type_counts:
-            return max(type_counts.items(), key=lambda x: x[1])[0]
+        As with _create_zones_bulk, a caller passing its connection invalidates
+        the cache itself after committing.
+        """
+        if self.db_pool:
+            async with self._conn(conn) as conn_:
+                await conn_.execute(
+                    "DELETE FROM zones WHERE id = ANY($1::uuid[])",
+                    zone_ids
+                )
+        else:
+            document_zones = self._zones_by_document[document_id]
+            for zone_id in zone_ids:
+                self._demo_zones.pop(zone_id, None)
+                document_zones.discard(zone_id)
+        
+        if self.redis and conn is None:
+            await self._clear_zones_cache_bulk(zone_ids, [document_id])
         
-        return ZoneType.UNKNOWN
+        logger.info(f"Deleted {len(zone_ids)} zones from document {document_id}")
     
     async def _clear_zone_cache(self, zone_id: UUID, document_id: UUID):
         """Clear zone-related cache entries"""
         if not self.redis:
             return
         
-        try:
-            # Clear specific zone cache
-            await self.redis.delete(f"zone:{zone_id}")
-            
-            # Clear document zones cache
-            await self.redis.delete(f"document:{document_id}:zones")
-            
-        except Exception as e:
-            logger.warning(f"Failed to clear zone cache: {e}")
\ No newline at end of file
+        await self._clear_zones_cache_bulk([zone_id], [document_id])
+    
+    async def _clear_zones_cache_bulk(
+        self,
+        zone_ids: Iterable[UUID],
+        document_ids: Iterable[UUID],
+        background: bool = False
+    ):
+        """Clear the cache entries of many zones and their documents in one round trip
+        
+        Writes wait for Redis, so no other reader is served the old value once
+        they return; background callers hand the keys to the invalidator instead.
+        """
+        zone_keys = [_zone_key(zone_id) for zone_id in zone_ids]
+        list_keys = [_zone_list_key(document_id) for document_id in set(document_ids)]
+        
+        # The rest of this request must not see what it just invalidated
+        memo = get_request_cache()
+        if memo:
+            for key in zone_keys:
+                memo.pop(key, None)
+            for key in list_keys:
+                memo.pop(key, None)
+        if _zone_list_l1 is not None:
+            for key in list_keys:
+                _zone_list_l1.pop(key, None)
+        
+        if not self.redis or not (zone_keys or list_keys):
+            return
+        
+        invalidator = _invalidators.get(self.redis)
+        if invalidator is None:
+            invalidator = _invalidators[self.redis] = _ZoneCacheInvalidator(self.redis)
+        if background:
+            # Repeated invalidations of the same keys within the window collapse into one
+            invalidator.submit(zone_keys, list_keys)
+        else:
+            await invalidator.unlink(zone_keys, list_keys)
\ No newline at end of file
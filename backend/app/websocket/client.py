@@ -5,13 +5,33 @@ import asyncio
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Optional, Callable, Any, List
+from typing import Dict, Optional, Callable, Any, List, Set
 from enum import Enum
 import websockets
 from websockets.client import WebSocketClientProtocol
 
 from .events import WebSocketEvent, EventType
 
+try:
+    import orjson
+    
+    def _json_dumps(value: Any) -> str:
+        # Text frames, as the server reads them with receive_text
+        return orjson.dumps(value).decode()
+    
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# Heartbeat frame with only the timestamp filled in per tick; an ISO timestamp
+# never needs JSON escaping
+_PING_TEMPLATE = '{"type":"ping","timestamp":"%s"}'
+
+# Inbound type strings to events; unknown types miss the lookup instead of
+# raising and catching a ValueError per message
+_EVENT_TYPE_MAP: Dict[str, EventType] = {event_type.value: event_type for event_type in EventType}
+
 
 class ConnectionState(str, Enum):
     """WebSocket connection states"""
@@ -45,7 +65,9 @@ class WebSocketClient:
         self.state = ConnectionState.DISCONNECTED
         self.reconnect_attempts = 0
         self.event_handlers: Dict[EventType, List[Callable]] = {}
-        self.subscribed_rooms: List[str] = []
+        # Coroutine handlers are classified once on registration rather than per event
+        self._async_handlers: Set[Callable] = set()
+        self.subscribed_rooms: Set[str] = set()
         self.last_ping = None
         self.last_pong = None
         
@@ -82,8 +104,9 @@ class WebSocketClient:
             self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
             self._listen_task = asyncio.create_task(self._listen_loop())
             
-            # Re-subscribe to rooms
-            for room_id in self.subscribed_rooms:
+            # Re-subscribe to rooms; a snapshot, as subscriptions may change
+            # while each join is awaited
+            for room_id in list(self.subscribed_rooms):
                 await self._send_control_message("join_room", {"room_id": room_id})
             
             # Trigger connection event
@@ -133,6 +156,8 @@ class WebSocketClient:
         if event_type not in self.event_handlers:
             self.event_handlers[event_type] = []
         self.event_handlers[event_type].append(handler)
+        if asyncio.iscoroutinefunction(handler):
+            self._async_handlers.add(handler)
         
     def off(self, event_type: EventType, handler: Callable[[Dict[str, Any]], None]) -> None:
         """Unregister an event handler"""
@@ -144,16 +169,14 @@ class WebSocketClient:
     
     async def subscribe_to_room(self, room_id: str) -> None:
         """Subscribe to a room for receiving targeted events"""
-        if room_id not in self.subscribed_rooms:
-            self.subscribed_rooms.append(room_id)
+        self.subscribed_rooms.add(room_id)
             
         if self.state == ConnectionState.CONNECTED:
             await self._send_control_message("join_room", {"room_id": room_id})
             
     async def unsubscribe_from_room(self, room_id: str) -> None:
         """Unsubscribe from a room"""
-        if room_id in self.subscribed_rooms:
-            self.subscribed_rooms.remove(room_id)
+        self.subscribed_rooms.discard(room_id)
             
         if self.state == ConnectionState.CONNECTED:
             await self._send_control_message("leave_room", {"room_id": room_id})
@@ -172,7 +195,7 @@ class WebSocketClient:
         }
         
         try:
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(_json_dumps(message))
         except Exception as e:
             self.logger.error(f"Failed to send message: {e}")
             # Trigger reconnection if connection is lost
@@ -184,7 +207,7 @@ class WebSocketClient:
             "state": self.state.value,
             "connected": self.state == ConnectionState.CONNECTED,
             "reconnect_attempts": self.reconnect_attempts,
-            "subscribed_rooms": self.subscribed_rooms.copy(),
+            "subscribed_rooms": sorted(self.subscribed_rooms),
             "last_ping": self.last_ping.isoformat() if self.last_ping else None,
             "last_pong": self.last_pong.isoformat() if self.last_pong else None
         }
@@ -203,7 +226,7 @@ class WebSocketClient:
         }
         
         try:
-            await self.websocket.send(json.dumps(control_message))
+            await self.websocket.send(_json_dumps(control_message))
         except Exception as e:
             self.logger.error(f"Failed to send control message: {e}")
     
@@ -227,7 +250,7 @@ class WebSocketClient:
     async def _handle_message(self, raw_message: str) -> None:
         """Handle incoming WebSocket message"""
         try:
-            data = json.loads(raw_message)
+            data = _json_loads(raw_message)
             
             # Handle pong responses
             if data.get("type") == "pong":
@@ -239,9 +262,8 @@ class WebSocketClient:
             if not event_type_str:
                 return
                 
-            try:
-                event_type = EventType(event_type_str)
-            except ValueError:
+            event_type = _EVENT_TYPE_MAP.get(event_type_str)
+            if event_type is None:
                 self.logger.warning(f"Unknown event type: {event_type_str}")
                 return
             
@@ -258,7 +280,7 @@ class WebSocketClient:
         if event_type in self.event_handlers:
             for handler in self.event_handlers[event_type]:
                 try:
-                    if asyncio.iscoroutinefunction(handler):
+                    if handler in self._async_handlers:
                         await handler(data)
                     else:
                         handler(data)
@@ -272,10 +294,7 @@ class WebSocketClient:
                 try:
                     if self.websocket:
                         self.last_ping = datetime.utcnow()
-                        await self.websocket.send(json.dumps({
-                            "type": "ping",
-                            "timestamp": self.last_ping.isoformat()
-                        }))
+                        await self.websocket.send(_PING_TEMPLATE % self.last_ping.isoformat())
                     
                     await asyncio.sleep(self.heartbeat_interval)
                     
@@ -52,6 +52,7 @@ class EventType(str, Enum):
     ZONE_DELETED = "zone.deleted"
     ZONE_LOCKED = "zone.locked"
     ZONE_UNLOCKED = "zone.unlocked"
+    ZONES_BATCH_UPDATED = "zones.batch_updated"
     
     # Export events
     EXPORT_STARTED = "export_started"
@@ -412,6 +413,29 @@ class ZoneCollaborationEvent(WebSocketEvent):
         super().__init__(type=event_type, data=data, **kwargs)
 
 
+class ZoneBatchUpdateEvent(WebSocketEvent):
+    """One update applied to several zones of a document"""
+    
+    type: EventType = EventType.ZONES_BATCH_UPDATED
+    
+    def __init__(
+        self,
+        document_id: str,
+        zone_ids: List[str],
+        user_id: Optional[str],
+        zone_data: Dict[str, Any],
+        **kwargs
+    ):
+        data = {
+            "document_id": document_id,
+            "zone_ids": zone_ids,
+            "user_id": user_id,
+            "action": "batch_update",
+            "zone_data": zone_data
+        }
+        super().__init__(type=EventType.ZONES_BATCH_UPDATED, data=data, **kwargs)
+
+
 class CollaborationConflictEvent(WebSocketEvent):
     """Collaboration conflict event"""
     
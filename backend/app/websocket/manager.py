@@ -591,6 +591,29 @@ class ConnectionManager:
             ),
             exclude_client=client_id
         )
+    
+    async def broadcast_zone_batch_update(
+        self,
+        client_id: Optional[str],
+        document_id: str,
+        zone_ids: List[str],
+        zone_data: Dict[str, Any]
+    ):
+        """Broadcast one update to many zones of a document as a single event"""
+        metadata = self.client_metadata.get(client_id, {})
+        
+        from .events import ZoneBatchUpdateEvent
+        
+        await self.broadcast_to_room(
+            f"document_{document_id}",
+            ZoneBatchUpdateEvent(
+                document_id=document_id,
+                zone_ids=zone_ids,
+                user_id=metadata.get("user_id"),
+                zone_data=zone_data
+            ),
+            exclude_client=client_id
+        )
 
 
 # Global connection manager instance (for backwards compatibility)
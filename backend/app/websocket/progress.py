@@ -2,14 +2,18 @@
 Processing progress event emitter for real-time updates
 """
 import asyncio
+import json
+import logging
 import uuid
 from datetime import datetime
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Set
 from enum import Enum
 
 from .events import EventEmitter, EventType, ProcessingProgressEvent, ZoneProcessingEvent
 from .manager import ConnectionManager
 
+logger = logging.getLogger(__name__)
+
 
 class ProgressStage(str, Enum):
     """Processing stages for progress tracking"""
@@ -311,4 +315,100 @@ class ProcessingProgressEmitter:
             await self.connection_manager.leave_room(job["user_id"], room_id)
             
             # Remove job data
-            del self.active_jobs[job_id] 
\ No newline at end of file
+            del self.active_jobs[job_id]
+
+
+class ProgressRelay:
+    """Relays published job progress into the local job rooms.
+
+    Workers publish progress to ``job:{job_id}:progress``; each API process runs
+    one pattern subscription and rebroadcasts to the ``job_{job_id}`` room, so
+    clients get pushed updates instead of polling the database. Deployments
+    without Redis get the same events through Postgres LISTEN/NOTIFY on a
+    connection held from the database pool.
+    """
+    
+    def __init__(self, connection_manager: ConnectionManager, redis_client=None, db_pool=None):
+        self.connection_manager = connection_manager
+        self.redis_client = redis_client
+        self.db_pool = db_pool
+        self._task: Optional[asyncio.Task] = None
+        self._pg_conn = None
+        # The event loop only keeps weak references to tasks, so in-flight
+        # NOTIFY relays are held here until they finish
+        self._relay_tasks: Set[asyncio.Task] = set()
+        
+    async def start(self) -> None:
+        """Start the pattern subscription (or LISTEN when Redis is unavailable)"""
+        if self.redis_client is not None:
+            if self._task is None:
+                self._task = asyncio.create_task(self._listen())
+        elif self.db_pool is not None and self._pg_conn is None:
+            from app.services.processing_service import PROGRESS_NOTIFY_CHANNEL
+            
+            self._pg_conn = await self.db_pool.acquire()
+            await self._pg_conn.add_listener(PROGRESS_NOTIFY_CHANNEL, self._on_notify)
+            
+    async def stop(self) -> None:
+        """Stop the pattern subscription"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        
+        if self._pg_conn is not None:
+            from app.services.processing_service import PROGRESS_NOTIFY_CHANNEL
+            
+            try:
+                await self._pg_conn.remove_listener(PROGRESS_NOTIFY_CHANNEL, self._on_notify)
+            finally:
+                await self.db_pool.release(self._pg_conn)
+                self._pg_conn = None
+        
+        for task in list(self._relay_tasks):
+            task.cancel()
+            
+    def _on_notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        task = asyncio.create_task(self._relay_payload(payload))
+        self._relay_tasks.add(task)
+        task.add_done_callback(self._relay_tasks.discard)
+        
+    async def _relay_payload(self, payload: str) -> None:
+        try:
+            await self._relay(json.loads(payload))
+        except Exception as e:
+            logger.warning(f"Failed to relay progress notification: {e}")
+            
+    async def _listen(self) -> None:
+        from app.services.processing_service import PROGRESS_CHANNEL_PATTERN
+        
+        pubsub = self.redis_client.pubsub()
+        await pubsub.psubscribe(PROGRESS_CHANNEL_PATTERN)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] != "pmessage":
+                    continue
+                try:
+                    await self._relay(json.loads(message["data"]))
+                except Exception as e:
+                    logger.warning(f"Failed to relay progress message: {e}")
+        finally:
+            await pubsub.punsubscribe(PROGRESS_CHANNEL_PATTERN)
+            await pubsub.close()
+            
+    async def _relay(self, update: Dict[str, Any]) -> None:
+        room_id = f"job_{update['job_id']}"
+        if not self.connection_manager.get_room_members(room_id):
+            return
+        
+        event = ProcessingProgressEvent(
+            document_id=update.get("document_id"),
+            job_id=update["job_id"],
+            progress=update["progress"],
+            current_operation=update.get("status", ""),
+            room_id=room_id
+        )
+        await self.connection_manager.broadcast_to_room(room_id, event)
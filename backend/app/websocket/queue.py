@@ -14,6 +14,9 @@ import msgpack
 
 from .events import WebSocketEvent, EventType
 
+# Set of persisted message ids, so restore never has to scan the keyspace
+PERSISTED_INDEX_KEY = "websocket:queue:index"
+
 
 class MessagePriority(int, Enum):
     """Message priority levels"""
@@ -493,7 +496,10 @@ class MessageQueue:
         try:
             key = f"websocket:queue:{message.id}"
             data = msgpack.packb(message.to_dict())
-            await self.redis_client.setex(key, self.default_ttl, data)
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.setex(key, self.default_ttl, data)
+            pipe.sadd(PERSISTED_INDEX_KEY, message.id)
+            await pipe.execute()
         except Exception as e:
             self.logger.error(f"Failed to persist message {message.id}: {e}")
     
@@ -504,7 +510,10 @@ class MessageQueue:
             
         try:
             key = f"websocket:queue:{message_id}"
-            await self.redis_client.delete(key)
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.unlink(key)
+            pipe.srem(PERSISTED_INDEX_KEY, message_id)
+            await pipe.execute()
         except Exception as e:
             self.logger.error(f"Failed to remove persisted message {message_id}: {e}")
             
@@ -514,28 +523,46 @@ class MessageQueue:
             return 0
             
         try:
-            pattern = "websocket:queue:*"
-            keys = await self.redis_client.keys(pattern)
+            # Walk the id index rather than KEYS, which blocks Redis for a
+            # scan of the whole keyspace, and fetch every message in one MGET
+            message_ids = [
+                message_id.decode() if isinstance(message_id, bytes) else message_id
+                for message_id in await self.redis_client.smembers(PERSISTED_INDEX_KEY)
+            ]
+            if not message_ids:
+                return 0
+            keys = [f"websocket:queue:{message_id}" for message_id in message_ids]
+            payloads = await self.redis_client.mget(keys)
             restored = 0
+            stale_ids = []
             
-            for key in keys:
+            for message_id, key, data in zip(message_ids, keys, payloads):
                 try:
-                    data = await self.redis_client.get(key)
-                    if data:
-                        message_dict = msgpack.unpackb(data)
-                        message = QueuedMessage.from_dict(message_dict)
+                    if not data:
+                        # The message's TTL ran out; only its index entry is left
+                        stale_ids.append(message_id)
+                        continue
+                    
+                    message_dict = msgpack.unpackb(data)
+                    message = QueuedMessage.from_dict(message_dict)
+                    
+                    # Re-queue if not expired
+                    if not message.expires_at or datetime.utcnow() < message.expires_at:
+                        self.priority_queues[message.priority].append(message)
+                        self.pending_messages[message.id] = message
+                        restored += 1
+                    else:
+                        # Clean up expired persisted message
+                        stale_ids.append(message_id)
                         
-                        # Re-queue if not expired
-                        if not message.expires_at or datetime.utcnow() < message.expires_at:
-                            self.priority_queues[message.priority].append(message)
-                            self.pending_messages[message.id] = message
-                            restored += 1
-                        else:
-                            # Clean up expired persisted message
-                            await self.redis_client.delete(key)
-                            
                 except Exception as e:
                     self.logger.error(f"Failed to restore message from {key}: {e}")
+            
+            if stale_ids:
+                pipe = self.redis_client.pipeline(transaction=False)
+                pipe.unlink(*(f"websocket:queue:{message_id}" for message_id in stale_ids))
+                pipe.srem(PERSISTED_INDEX_KEY, *stale_ids)
+                await pipe.execute()
                     
             self.logger.info(f"Restored {restored} messages from persistence")
             return restored
@@ -0,0 +1,10 @@
+"""
+Background workers for the PDF Intelligence Platform
+"""
+
+from .processing import WorkerSettings, process_document_task
+
+__all__ = [
+    "WorkerSettings",
+    "process_document_task"
+]
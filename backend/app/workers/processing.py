@@ -0,0 +1,82 @@
+"""
+arq worker for document processing jobs
+
+Run one or more workers alongside the API with:
+    arq app.workers.processing.WorkerSettings
+"""
+
+import uuid
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+from arq import cron
+from arq.connections import RedisSettings
+
+from app.config.settings import get_settings
+from app.models.processing import ProcessingRequest
+from app.services.processing_service import ProcessingService
+from app.dependencies import (
+    get_database_pool, get_read_database_pool, get_redis_client,
+    cleanup_database_pool, cleanup_redis_client
+)
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+async def startup(ctx: Dict[str, Any]):
+    """Create the shared processing service for this worker process"""
+    ctx["processing_service"] = ProcessingService(
+        db_pool=await get_database_pool(),
+        db_pool_read=await get_read_database_pool(),
+        redis_client=await get_redis_client()
+    )
+    logger.info("Processing worker started")
+
+async def shutdown(ctx: Dict[str, Any]):
+    """Release worker resources"""
+    await cleanup_database_pool()
+    await cleanup_redis_client()
+    logger.info("Processing worker stopped")
+
+async def process_document_task(
+    ctx: Dict[str, Any],
+    job_id: str,
+    document_id: str,
+    request_data: Dict[str, Any]
+):
+    """Run a queued processing job"""
+    processing_service: ProcessingService = ctx["processing_service"]
+    await processing_service.process_document_background(
+        uuid.UUID(job_id),
+        uuid.UUID(document_id),
+        ProcessingRequest(**request_data)
+    )
+
+async def recover_queued_jobs(ctx: Dict[str, Any]):
+    """Pick up jobs left queued past the job timeout (e.g. lost with an API process)"""
+    processing_service: ProcessingService = ctx["processing_service"]
+    queued_before = datetime.utcnow() - timedelta(seconds=settings.job_timeout)
+    
+    jobs = await processing_service.claim_next_job(
+        n=settings.max_concurrent_jobs, queued_before=queued_before
+    )
+    for job in jobs:
+        logger.warning(f"Recovering stale queued job {job.id}")
+    
+    # Failures are already recorded on the job rows
+    await asyncio.gather(
+        *(processing_service.run_claimed_job(job) for job in jobs),
+        return_exceptions=True
+    )
+
+class WorkerSettings:
+    """arq worker configuration"""
+    functions = [process_document_task]
+    cron_jobs = [cron(recover_queued_jobs, minute={0, 15, 30, 45})]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(settings.redis_url)
+    max_jobs = settings.max_concurrent_jobs
+    job_timeout = settings.job_timeout
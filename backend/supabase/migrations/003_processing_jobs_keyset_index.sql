@@ -0,0 +1,10 @@
+-- PDF Intelligence Platform - Keyset pagination index for processing jobs
+-- Migration: 003_processing_jobs_keyset_index.sql
+-- Created: 2026-10-15
+
+-- Backs ORDER BY created_at DESC, id DESC and the (created_at, id) < (...) cursor predicate
+CREATE INDEX IF NOT EXISTS idx_processing_jobs_created_at_id
+    ON processing_jobs(created_at DESC, id DESC);
+
+-- Migration completion marker
+INSERT INTO schema_migrations (version) VALUES ('003_processing_jobs_keyset_index');
@@ -0,0 +1,17 @@
+-- PDF Intelligence Platform - Indexes for processing statistics
+-- Migration: 004_processing_stats_indexes.sql
+-- Created: 2026-10-15
+
+-- Active jobs are a small slice of the table; keep a partial index so the
+-- active count is an index-only scan instead of a full table scan
+CREATE INDEX IF NOT EXISTS idx_processing_jobs_active_status
+    ON processing_jobs(status)
+    WHERE status IN ('queued', 'processing');
+
+-- Supports AVG(completed_at - started_at) over finished jobs
+CREATE INDEX IF NOT EXISTS idx_processing_jobs_completed_started
+    ON processing_jobs(completed_at, started_at)
+    WHERE completed_at IS NOT NULL;
+
+-- Migration completion marker
+INSERT INTO schema_migrations (version) VALUES ('004_processing_stats_indexes');
@@ -0,0 +1,21 @@
+-- PDF Intelligence Platform - Per-document processing job indexes
+-- Migration: 005_processing_jobs_document_indexes.sql
+-- Created: 2026-10-15
+
+-- get_latest_job: WHERE document_id = $1 ORDER BY created_at DESC LIMIT 1
+CREATE INDEX IF NOT EXISTS idx_processing_jobs_document_created
+    ON processing_jobs(document_id, created_at DESC);
+
+-- get_active_job / cancel_processing: the active slice per document
+CREATE INDEX IF NOT EXISTS idx_processing_jobs_document_active
+    ON processing_jobs(document_id, created_at DESC)
+    WHERE status IN ('queued', 'processing');
+
+-- Covered by the leading column of idx_processing_jobs_document_created
+DROP INDEX IF EXISTS idx_processing_jobs_document_id;
+
+-- zones (document_id, zone_index) is already indexed by its UNIQUE constraint,
+-- which serves ORDER BY zone_index in get_document_zones without a sort
+
+-- Migration completion marker
+INSERT INTO schema_migrations (version) VALUES ('005_processing_jobs_document_indexes');
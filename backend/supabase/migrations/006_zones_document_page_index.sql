@@ -0,0 +1,18 @@
+-- PDF Intelligence Platform - Zone list index
+-- Migration: 006_zones_document_page_index.sql
+-- Created: 2026-10-15
+
+-- get_zones_by_document: WHERE document_id = $1 [AND page_number = ...]
+-- ORDER BY page_number, zone_index. Matching the index to the ORDER BY removes
+-- the sort node, and the INCLUDE columns let the statistics aggregate run as
+-- an index-only scan.
+CREATE INDEX IF NOT EXISTS idx_zones_doc_page_idx
+    ON zones(document_id, page_number, zone_index)
+    INCLUDE (zone_type, status, confidence);
+
+-- Both are prefixes of idx_zones_doc_page_idx
+DROP INDEX IF EXISTS idx_zones_page_number;
+DROP INDEX IF EXISTS idx_zones_document_id;
+
+-- Migration completion marker
+INSERT INTO schema_migrations (version) VALUES ('006_zones_document_page_index');
@@ -0,0 +1,31 @@
+-- PDF Intelligence Platform - Typed zone coordinates
+-- Migration: 007_zones_coordinate_columns.sql
+-- Created: 2026-10-15
+
+-- Zone reads only need the six coordinate numbers. Exposing them as float8
+-- columns lets asyncpg decode them natively instead of shipping and parsing
+-- the coordinates JSONB on every row. The columns are generated from the JSONB,
+-- so every existing writer keeps them in sync without change.
+ALTER TABLE zones
+    ADD COLUMN IF NOT EXISTS x DOUBLE PRECISION
+        GENERATED ALWAYS AS ((coordinates->>'x')::double precision) STORED,
+    ADD COLUMN IF NOT EXISTS y DOUBLE PRECISION
+        GENERATED ALWAYS AS ((coordinates->>'y')::double precision) STORED,
+    ADD COLUMN IF NOT EXISTS width DOUBLE PRECISION
+        GENERATED ALWAYS AS ((coordinates->>'width')::double precision) STORED,
+    ADD COLUMN IF NOT EXISTS height DOUBLE PRECISION
+        GENERATED ALWAYS AS ((coordinates->>'height')::double precision) STORED,
+    ADD COLUMN IF NOT EXISTS page_width DOUBLE PRECISION
+        GENERATED ALWAYS AS ((coordinates->>'page_width')::double precision) STORED,
+    ADD COLUMN IF NOT EXISTS page_height DOUBLE PRECISION
+        GENERATED ALWAYS AS ((coordinates->>'page_height')::double precision) STORED;
+
+COMMENT ON COLUMN zones.x IS 'Zone X coordinate, generated from coordinates';
+COMMENT ON COLUMN zones.y IS 'Zone Y coordinate, generated from coordinates';
+COMMENT ON COLUMN zones.width IS 'Zone width, generated from coordinates';
+COMMENT ON COLUMN zones.height IS 'Zone height, generated from coordinates';
+COMMENT ON COLUMN zones.page_width IS 'Page width, generated from coordinates';
+COMMENT ON COLUMN zones.page_height IS 'Page height, generated from coordinates';
+
+-- Migration completion marker
+INSERT INTO schema_migrations (version) VALUES ('007_zones_coordinate_columns');
@@ -0,0 +1,214 @@
+"""
+Unit tests for bulk zone updates, processing job paging cursors and progress
+write coalescing
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.middleware.errors import InvalidCursorError, ZoneNotFoundError
+from app.models.processing import ZoneUpdate
+from app.services.processing_service import (
+    BULK_UPDATE_ZONE_SQL, ProcessingService, ProgressCoalescer, UPDATE_JOB_PROGRESS_SQL
+)
+
+
+class _DocumentZonesPool:
+    """Stands in for an asyncpg pool; the bulk UPDATE matches the zones given here"""
+
+    def __init__(self, zone_ids):
+        self.zone_ids = set(zone_ids)
+        self.calls = []
+        self.rolled_back = False
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self
+
+    @asynccontextmanager
+    async def transaction(self):
+        try:
+            yield
+        except Exception:
+            self.rolled_back = True
+            raise
+
+    async def fetch(self, query, *args):
+        self.calls.append((query, args))
+        return [{"id": zone_id} for zone_id in args[0] if zone_id in self.zone_ids]
+
+
+async def test_bulk_update_zones_binds_columns_and_document():
+    document_id, first, second = uuid4(), uuid4(), uuid4()
+    pool = _DocumentZonesPool([first, second])
+    updates = [
+        (first, ZoneUpdate(content="old")),
+        (second, ZoneUpdate(zone_type="table", confidence=0.5)),
+        (first, ZoneUpdate(content="new", status="completed")),
+    ]
+
+    updated = await ProcessingService(db_pool=pool).bulk_update_zones(document_id, updates)
+
+    assert updated == 2
+    (query, args), = pool.calls
+    zone_ids, zone_types, contents, confidences, statuses, _, bound_document = args
+    assert query == BULK_UPDATE_ZONE_SQL
+    assert zone_ids == [first, second]
+    assert zone_types == [None, "table"]
+    assert contents == ["new", None]
+    assert confidences == [None, 0.5]
+    assert statuses == ["completed", None]
+    assert bound_document == document_id
+
+
+async def test_bulk_update_zones_outside_the_document_update_nothing():
+    owned, foreign = uuid4(), uuid4()
+    pool = _DocumentZonesPool([owned])
+    updates = [(owned, ZoneUpdate(content="a")), (foreign, ZoneUpdate(content="b"))]
+
+    with pytest.raises(ZoneNotFoundError) as exc_info:
+        await ProcessingService(db_pool=pool).bulk_update_zones(uuid4(), updates)
+
+    assert exc_info.value.status_code == 404
+    assert str(foreign) in exc_info.value.message
+    assert pool.rolled_back
+
+
+async def test_bulk_update_zones_without_database_updates_nothing():
+    assert await ProcessingService().bulk_update_zones(uuid4(), [(uuid4(), ZoneUpdate())]) == 0
+
+
+def test_job_cursor_round_trips():
+    row = {"created_at": datetime(2024, 5, 1, 12, 30, 15, 250000), "id": uuid4()}
+
+    cursor = ProcessingService._encode_job_cursor(row)
+
+    assert ProcessingService._decode_job_cursor(cursor) == (row["created_at"], row["id"])
+
+
+@pytest.mark.parametrize("cursor", [
+    "",
+    "no-separator",
+    "not-a-date|" + str(uuid4()),
+    "2024-05-01T12:30:15|not-a-uuid",
+])
+def test_malformed_job_cursor_raises_invalid_cursor(cursor):
+    with pytest.raises(InvalidCursorError) as exc_info:
+        ProcessingService._decode_job_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
+
+
+class _RecordingPool:
+    """Stands in for an asyncpg pool whose connections keep each executemany"""
+
+    def __init__(self):
+        self.batches = []
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield self
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def execute(self, query, *args):
+        pass
+
+    async def executemany(self, query, rows):
+        self.batches.append((query, list(rows)))
+
+
+async def test_coalescer_flush_keeps_latest_progress_per_job():
+    pool = _RecordingPool()
+    coalescer = ProgressCoalescer(pool, flush_interval=60)
+    first, second = uuid4(), uuid4()
+
+    coalescer.submit(first, 10.0)
+    coalescer.submit(second, 5.0)
+    coalescer.submit(first, 40.0)
+    coalescer._flush_task.cancel()
+    await coalescer.flush()
+
+    (query, rows), = pool.batches
+    assert query == UPDATE_JOB_PROGRESS_SQL
+    assert {(job_id, progress) for progress, _, job_id in rows} == {(first, 40.0), (second, 5.0)}
+
+
+async def test_coalescer_discard_drops_buffered_progress():
+    pool = _RecordingPool()
+    coalescer = ProgressCoalescer(pool, flush_interval=60)
+    kept, finished = uuid4(), uuid4()
+
+    coalescer.submit(kept, 10.0)
+    coalescer.submit(finished, 90.0)
+    coalescer.discard(finished)
+    coalescer._flush_task.cancel()
+    await coalescer.flush()
+
+    (_, rows), = pool.batches
+    assert [job_id for _, _, job_id in rows] == [kept]
+
+
+async def test_coalescer_flushes_once_per_window():
+    pool = _RecordingPool()
+    coalescer = ProgressCoalescer(pool, flush_interval=0)
+    job_id = uuid4()
+
+    for progress in (1.0, 2.0, 3.0):
+        coalescer.submit(job_id, progress)
+    await coalescer._flush_task
+
+    assert len(pool.batches) == 1
+    (_, rows), = pool.batches
+    assert [progress for progress, _, _ in rows] == [3.0]
+
+
+class _BlockingPool(_RecordingPool):
+    """A _RecordingPool whose first executemany waits until released"""
+
+    def __init__(self):
+        super().__init__()
+        self.writing = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def executemany(self, query, rows):
+        if not self.batches:
+            self.writing.set()
+            await self.release.wait()
+        await super().executemany(query, rows)
+
+
+async def test_coalescer_flushes_progress_submitted_during_a_write():
+    pool = _BlockingPool()
+    coalescer = ProgressCoalescer(pool, flush_interval=0)
+    job_id = uuid4()
+
+    coalescer.submit(job_id, 10.0)
+    await pool.writing.wait()
+    coalescer.submit(job_id, 20.0)
+    pool.release.set()
+    await coalescer._flush_task  # the write that was in flight
+    await coalescer._flush_task  # the window scheduled after it
+
+    assert [rows[0][0] for _, rows in pool.batches] == [10.0, 20.0]
+
+
+async def test_coalescer_flush_with_nothing_pending_skips_the_database():
+    pool = _RecordingPool()
+
+    await ProgressCoalescer(pool).flush()
+
+    assert pool.batches == []
+
+
+def test_coalescer_is_shared_per_pool():
+    pool, other = _RecordingPool(), _RecordingPool()
+
+    assert ProgressCoalescer.for_pool(pool) is ProgressCoalescer.for_pool(pool)
+    assert ProgressCoalescer.for_pool(pool) is not ProgressCoalescer.for_pool(other)
@@ -0,0 +1,323 @@
+"""
+Unit tests for the zone service's SQL parameter building and pure helpers
+"""
+
+import json
+import os
+from contextlib import asynccontextmanager
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+import redis.asyncio as redis
+from redis.crc import key_slot
+
+from app.models.processing import Zone, ZoneCoordinates, ZoneStatus, ZoneType
+from app.models.zone import ZoneCreate, ZoneUpdate
+from app.services import zone_service
+from app.services.zone_service import (
+    CACHE_INVALIDATION_BATCH, ZONE_VERSION_TTL, ZoneService, _ZONE_UPDATE_COLUMNS,
+    _ZONE_VERSION_CHECK_AND_BUMP, _ZoneCacheInvalidator, _unlink_batches, _zone_key,
+    _zone_update_params, _zone_version_key
+)
+
+
+def _mask_of(*columns):
+    return sum(1 << _ZONE_UPDATE_COLUMNS.index(column) for column in columns)
+
+
+def test_update_params_from_validated_update_bind_enum_values():
+    # use_enum_values leaves plain strings on a validated model
+    zone_update = ZoneUpdate(zone_type="text", status="completed")
+
+    mask, values = _zone_update_params(zone_update)
+
+    assert mask == _mask_of("zone_type", "status")
+    assert values == ["text", "completed"]
+
+
+def test_update_params_from_constructed_update_bind_enum_values():
+    zone_update = ZoneUpdate.model_construct(zone_type=ZoneType.TABLE, status=ZoneStatus.FAILED)
+
+    mask, values = _zone_update_params(zone_update)
+
+    assert mask == _mask_of("zone_type", "status")
+    assert values == ["table", "failed"]
+
+
+def test_update_params_encode_jsonb_columns_in_column_order():
+    zone_update = ZoneUpdate(
+        metadata={"source": "ocr"},
+        confidence=0.5,
+        coordinates=ZoneCoordinates(x=1, y=2, width=3, height=4, page_width=10, page_height=20)
+    )
+
+    mask, values = _zone_update_params(zone_update)
+
+    assert mask == _mask_of("coordinates", "confidence", "metadata")
+    coordinates, confidence, metadata = values
+    assert json.loads(coordinates) == {
+        "x": 1.0, "y": 2.0, "width": 3.0, "height": 4.0, "page_width": 10.0, "page_height": 20.0
+    }
+    assert confidence == 0.5
+    assert json.loads(metadata) == {"source": "ocr"}
+
+
+def test_update_params_skip_unset_fields():
+    assert _zone_update_params(ZoneUpdate()) == (0, [])
+
+
+class _RecordingConnection:
+    """Stands in for an asyncpg connection, keeping each statement's arguments"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def execute(self, query, *args):
+        self.calls.append((query, args))
+        return "INSERT 0 %d" % len(args[0])
+
+
+def _zone_create(document_id, zone_index, zone_type):
+    return ZoneCreate(
+        document_id=document_id,
+        zone_index=zone_index,
+        page_number=1,
+        zone_type=zone_type,
+        coordinates=ZoneCoordinates(x=0, y=0, width=5, height=5, page_width=10, page_height=10),
+        content=f"zone {zone_index}",
+        metadata={"index": zone_index}
+    )
+
+
+async def test_create_zones_bulk_binds_one_array_per_column():
+    document_id = uuid4()
+    conn = _RecordingConnection()
+    zones_data = [_zone_create(document_id, 0, "text"), _zone_create(document_id, 1, ZoneType.TABLE)]
+
+    responses = await ZoneService()._create_zones_bulk(zones_data, ZoneStatus.COMPLETED, conn)
+
+    (_, args), = conn.calls
+    (zone_ids, document_ids, zone_indexes, page_numbers, zone_types, coordinates,
+     contents, confidences, tools, metadata, status, now) = args
+    assert zone_ids == [response.id for response in responses]
+    assert document_ids == [document_id, document_id]
+    assert zone_indexes == [0, 1]
+    assert page_numbers == [1, 1]
+    assert zone_types == ["text", "table"]
+    assert [json.loads(c)["width"] for c in coordinates] == [5.0, 5.0]
+    assert contents == ["zone 0", "zone 1"]
+    assert confidences == [None, None]
+    assert tools == [None, None]
+    assert [json.loads(m) for m in metadata] == [{"index": 0}, {"index": 1}]
+    assert status == "completed"
+    assert all(response.created_at == now for response in responses)
+
+
+class _KeysetPool:
+    """Stands in for an asyncpg pool over one document's zones, counting acquires"""
+
+    def __init__(self, document_id, zone_count):
+        now = datetime.utcnow()
+        self.rows = [
+            {
+                "id": uuid4(), "document_id": document_id, "zone_index": index, "page_number": 1 + index // 3,
+                "zone_type": "text", "content": f"zone {index}", "confidence": None, "processing_tool": None,
+                "status": "completed", "error_message": None, "processing_duration": None,
+                "created_at": now, "updated_at": now, "metadata": {},
+                "x": 0.0, "y": 0.0, "width": 5.0, "height": 5.0, "page_width": 10.0, "page_height": 10.0
+            }
+            for index in range(zone_count)
+        ]
+        self.acquired = 0
+
+    @asynccontextmanager
+    async def acquire(self):
+        self.acquired += 1
+        yield self
+
+    async def fetch(self, query, *args):
+        *_, after_page, after_index, limit = args
+        rows = [r for r in self.rows if (r["page_number"], r["zone_index"]) > (after_page, after_index)]
+        return rows[:limit]
+
+
+async def test_stream_zones_pages_by_keyset(monkeypatch):
+    monkeypatch.setattr(zone_service, "ZONE_CURSOR_PREFETCH", 4)
+    document_id = uuid4()
+    pool = _KeysetPool(document_id, 10)
+
+    zones = [zone async for zone in ZoneService(db_pool=pool).iter_zones_by_document(document_id)]
+
+    assert [zone.zone_index for zone in zones] == list(range(10))
+    assert pool.acquired == 3
+
+
+def test_unlink_batches_cap_batch_size():
+    keys = [_zone_key(uuid4()) for _ in range(CACHE_INVALIDATION_BATCH + 1)]
+
+    batches = list(_unlink_batches(keys, by_slot=False))
+
+    assert [len(batch) for batch in batches] == [CACHE_INVALIDATION_BATCH, 1]
+    assert sum(batches, []) == keys
+
+
+def test_unlink_batches_by_slot_never_span_slots():
+    keys = [_zone_key(uuid4()) for _ in range(500)]
+
+    batches = list(_unlink_batches(keys, by_slot=True))
+
+    for batch in batches:
+        assert len(batch) <= CACHE_INVALIDATION_BATCH
+        assert len({key_slot(key.encode()) for key in batch}) == 1
+    assert sorted(sum(batches, [])) == sorted(keys)
+
+
+class _FlakyPipeline:
+    """Stands in for a Redis pipeline whose first execute fails"""
+
+    def __init__(self, redis_client):
+        self.redis = redis_client
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.commands.append((name, *args))
+
+    async def execute(self, raise_on_error=True):
+        self.redis.executions += 1
+        if self.redis.executions == 1:
+            raise ConnectionError("connection reset")
+        self.redis.sent.extend(self.commands)
+
+
+class _FlakyRedis:
+    def __init__(self):
+        self.executions = 0
+        self.sent = []
+
+    def pipeline(self, transaction=True):
+        return _FlakyPipeline(self)
+
+
+async def test_invalidator_retries_a_failed_round_trip_once():
+    redis_client = _FlakyRedis()
+    zone_key = _zone_key(uuid4())
+
+    await _ZoneCacheInvalidator(redis_client).unlink([zone_key], [])
+
+    assert redis_client.executions == 2
+    assert redis_client.sent == [("unlink", zone_key)]
+
+
+def _zone(zone_type, content, x=0.0, y=0.0):
+    now = datetime.utcnow()
+    return Zone(
+        id=uuid4(),
+        document_id=uuid4(),
+        zone_index=0,
+        page_number=1,
+        zone_type=zone_type,
+        coordinates=ZoneCoordinates(x=x, y=y, width=1, height=1, page_width=100, page_height=100),
+        content=content,
+        created_at=now,
+        updated_at=now
+    )
+
+
+def test_merge_content_concatenate_separator_follows_formatting():
+    zones = [_zone("text", "a"), _zone("text", None), _zone("text", "b")]
+
+    assert ZoneService()._merge_content(zones, "concatenate", True) == "a\n\nb"
+    assert ZoneService()._merge_content(zones, "concatenate", False) == "a b"
+
+
+def test_merge_content_smart_groups_by_zone_type():
+    zones = [
+        _zone("text", "a"), _zone("table", "r1"), _zone("text", "b"),
+        _zone("table", "r2"), _zone("image", "i")
+    ]
+
+    merged = ZoneService()._merge_content(zones, "smart", True)
+
+    assert merged == "a\n\nb\n\nr1\nr2\n\ni"
+
+
+def test_merge_content_preserve_layout_reads_top_to_bottom_left_to_right():
+    zones = [
+        _zone("text", "bottom", x=0, y=50),
+        _zone("text", "top right", x=40, y=10),
+        _zone("text", "top left", x=5, y=10)
+    ]
+
+    merged = ZoneService()._merge_content(zones, "preserve_layout", True)
+
+    assert merged == "top left\ntop right\nbottom"
+
+
+def test_merge_content_without_content_is_none():
+    assert ZoneService()._merge_content([_zone("text", None)], "smart", True) is None
+
+
+def test_merge_content_rejects_unknown_strategy():
+    with pytest.raises(ValueError):
+        ZoneService()._merge_content([_zone("text", "a")], "shuffle", True)
+
+
+class _EvalRecordingRedis:
+    """Answers EVAL with a canned reply, keeping the arguments"""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = []
+
+    async def eval(self, script, numkeys, *args):
+        self.calls.append((script, numkeys, args))
+        if isinstance(self.reply, Exception):
+            raise self.reply
+        return self.reply
+
+
+async def test_version_check_sends_key_version_and_ttl_to_the_script():
+    zone_id = uuid4()
+    fake = _EvalRecordingRedis([1, 4])
+
+    result = await ZoneService(redis_client=fake)._check_and_bump_zone_version(zone_id, 3)
+
+    assert result == (True, 4)
+    assert fake.calls == [
+        (_ZONE_VERSION_CHECK_AND_BUMP, 1, (_zone_version_key(zone_id), 3, ZONE_VERSION_TTL))
+    ]
+
+
+async def test_version_check_reports_stale_version():
+    fake = _EvalRecordingRedis([0, 7])
+
+    result = await ZoneService(redis_client=fake)._check_and_bump_zone_version(uuid4(), 2)
+
+    assert result == (False, 7)
+
+
+async def test_version_check_falls_back_to_local_counter():
+    zone_id = uuid4()
+    service = ZoneService(redis_client=_EvalRecordingRedis(ConnectionError("down")))
+
+    assert await service._check_and_bump_zone_version(zone_id, 0) == (True, 1)
+    assert await service._check_and_bump_zone_version(zone_id, 1) == (True, 2)
+    assert await service._check_and_bump_zone_version(zone_id, 1) == (False, 2)
+    assert await service._bump_zone_version(zone_id) == 3
+
+
+@pytest.mark.skipif("REDIS_URL" not in os.environ, reason="needs a Redis server (REDIS_URL)")
+async def test_version_check_script_against_redis():
+    client = redis.from_url(os.environ["REDIS_URL"], decode_responses=True)
+    zone_id = uuid4()
+    service = ZoneService(redis_client=client)
+    try:
+        assert await service._check_and_bump_zone_version(zone_id, 0) == (True, 1)
+        assert await service._check_and_bump_zone_version(zone_id, 1) == (True, 2)
+        assert await service._check_and_bump_zone_version(zone_id, 1) == (False, 2)
+        assert await service._bump_zone_version(zone_id) == 3
+        assert 0 < await client.ttl(_zone_version_key(zone_id)) <= ZONE_VERSION_TTL
+    finally:
+        await client.delete(_zone_version_key(zone_id))
+        await client.aclose()